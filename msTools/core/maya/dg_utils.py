@@ -385,6 +385,57 @@ def iterDependenciesByEdge(root, directionType=om2.MItDependencyGraph.kDownstrea
         yield edge
 
 
+def getDirectEdges(nodes, directionType=om2.MItDependencyGraph.kDownstream, includeNodes=None, excludeNodes=None):
+    """Return the direct dependencies of a group of dependency nodes as edges represented by pairs of connected source and destination plugs.
+
+    Provides an alternative to calling :func:`iterDependenciesByEdge` with ``walk=False`` for each node, avoiding the setup of a dependency graph iterator per node.
+    Edges are retrieved directly from the connected plugs of each node, including connections to unit conversion nodes.
+
+    Args:
+        nodes (iterable [:class:`OpenMaya.MObject`]): Wrappers of dependency nodes from which to retrieve direct dependencies.
+        directionType (:class:`int`, optional): The direction of dependencies for each node.
+            Valid values are either :attr:`OpenMaya.MItDependencyGraph.kDownstream` or :attr:`OpenMaya.MItDependencyGraph.kUpstream`.
+            Values correspond to either downstream or upstream dependencies of each node. Defaults to :attr:`OpenMaya.MItDependencyGraph.kDownstream`.
+        includeNodes (iterable [:class:`OpenMaya.MObject`], optional): Only return edges whose dependency is one of these nodes.
+            Defaults to :data:`None` - no inclusive node filtering will occur.
+        excludeNodes (iterable [:class:`OpenMaya.MObject`], optional): Only return edges whose dependency is not one of these nodes.
+            Defaults to :data:`None` - no exclusive node filtering will occur.
+
+    Raises:
+        :exc:`msTools.core.maya.exceptions.MayaTypeError`: If any of the ``nodes`` do not reference a dependency node.
+
+    Returns:
+        :class:`list` [(:class:`OpenMaya.MPlug`, :class:`OpenMaya.MPlug`)]: Two-element :class:`tuple` pairs of connected source and destination plugs.
+        Each pair represents a connected edge in the graph, ordered by node.
+    """
+    edges = []
+    isDownstream = directionType == om2.MItDependencyGraph.kDownstream
+    includeHashCodes = None if includeNodes is None else {om2.MObjectHandle(includeNode).hashCode() for includeNode in includeNodes}
+    excludeHashCodes = None if excludeNodes is None else {om2.MObjectHandle(excludeNode).hashCode() for excludeNode in excludeNodes}
+
+    def isAccepted(plug):
+        if includeHashCodes is None and excludeHashCodes is None:
+            return True
+
+        hashCode = om2.MObjectHandle(plug.node()).hashCode()
+        return (includeHashCodes is None or hashCode in includeHashCodes) and (excludeHashCodes is None or hashCode not in excludeHashCodes)
+
+    for node in nodes:
+        OM.validateNodeType(node)
+
+        for plug in om2.MFnDependencyNode(node).getConnections():
+            if isDownstream:
+                if plug.isSource:
+                    edges.extend((plug, destPlug) for destPlug in plug.destinationsWithConversions() if isAccepted(destPlug))
+            elif plug.isDestination:
+                sourcePlug = plug.sourceWithConversion()
+
+                if isAccepted(sourcePlug):
+                    edges.append((sourcePlug, plug))
+
+    return edges
+
+
 def getCachedComponent(plug, instanceNumber=0):
     """Retrieve cached component data from a dependency node plug. Designed for use with :func:`cacheComponent`.
 
@@ -1,6 +1,10 @@
+import collections
+import contextlib
 from datetime import datetime
+import functools
 import getpass
 import imp
+import itertools
 import json
 import logging
 import os
@@ -27,6 +31,64 @@ from msTools.metadata.systems import base as BASE
 from msTools.vendor.enum import Enum
 
 
+# ----------------------------------------------------------------------------
+# --- Globals ---
+# ----------------------------------------------------------------------------
+
+_DEFAULT_AUTHOR = getpass.getuser()
+_TIMESTAMP_FORMAT = "%d/%m/%Y %H:%M:%S"
+_EXPORT_FILE_TYPE = "mayaAscii"
+
+
+def _timestamp():
+    """Return the current local date and time, formatted for use as a component creation date."""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+
+def _exportSelected(filePath, force=False):
+    """Export the active selection to a Maya ASCII file, preserving references.
+    Exports via :class:`OpenMaya.MFileIO` which avoids the flag parsing of the ``file`` command.
+    Raises :exc:`~exceptions.RuntimeError` if the file already exists and ``force`` is :data:`False`.
+    """
+    if not force and os.path.exists(filePath):
+        raise RuntimeError("{}: File already exists, use `force` to overwrite".format(filePath))
+
+    om2.MFileIO.exportSelected(filePath, type=_EXPORT_FILE_TYPE, preserveReferences=True)
+
+
+def _cachedNodeNamer(getNodeName):
+    """Return a callable which names nodes via ``getNodeName``, caching each name by :class:`OpenMaya.MObjectHandle` hash code for the lifetime of the callable."""
+    nodeNames = {}
+
+    def getCachedNodeName(node):
+        hashCode = om2.MObjectHandle(node).hashCode()
+
+        try:
+            return nodeNames[hashCode]
+        except KeyError:
+            nodeName = nodeNames[hashCode] = getNodeName(node)
+            return nodeName
+
+    return getCachedNodeName
+
+
+def _cachedPlugNamer(useFullNames=False):
+    """Return a callable which produces names equivalent to :func:`msTools.core.maya.name_utils.getPlugPartialName` or :func:`msTools.core.maya.name_utils.getPlugFullName`.
+    Node names are cached for the lifetime of the callable so that nodes with many connected plugs are only named once.
+    """
+    if useFullNames:
+        getNodeName = _cachedNodeNamer(NAME.getNodeFullName)
+        getPlugName = NAME.getPlugFullName
+    else:
+        getNodeName = _cachedNodeNamer(NAME.getNodePartialName)
+        getPlugName = NAME.getPlugPartialName
+
+    def getCachedPlugName(plug):
+        return '.'.join([getNodeName(plug.node()), getPlugName(plug, includeNodeName=False)])
+
+    return getCachedPlugName
+
+
 # ----------------------------------------------------------------------------
 # --- Retrieve : Component ---
 # ----------------------------------------------------------------------------
@@ -237,7 +299,7 @@ class MetaComponent(BASE.MetaDag):
     :access: R
     """
 
-    EXCLUSIVE = set(["_containerFn", "author", "componentId", "isBlackBoxed", "isGuided"])
+    EXCLUSIVE = set(["_containerFn", "_memberSetCache", "_pathTemplates", "author", "componentId", "isBlackBoxed", "isGuided"])
     """:class:`set` [:class:`str`]: Defines exclusive instance attributes which can be set using the default :meth:`object.__setattr__` behaviour.
 
     - Includes the names of property setters defined by this `mType`.
@@ -425,6 +487,10 @@ class MetaComponent(BASE.MetaDag):
         :access: R
         """
 
+    # Aliases used for identity comparisons against the member type singletons
+    _HIERARCHY = MemberType.Hierarchy
+    _SETTINGS = MemberType.Settings
+
     # --- Instantiation ----------------------------------------------------------------------------
 
     def __init__(self, node=None, componentType=None, componentId=None, stateTracking=True):
@@ -454,7 +520,7 @@ class MetaComponent(BASE.MetaDag):
             :exc:`~exceptions.ValueError`: If ``node`` is :data:`None` and ``componentId`` is already assigned to a component within the active namespace.
             :exc:`~exceptions.RuntimeError`: If a ``node`` is given but it does not have a valid `mType` tag or component tag.
         """
-        log.debug("MetaComponent.__init__(node={}, componentType={}, componentId={}, stateTracking={})".format(node, componentType, componentId, stateTracking))
+        log.debug("MetaComponent.__init__(node=%s, componentType=%s, componentId=%s, stateTracking=%s)", node, componentType, componentId, stateTracking)
 
         name = None
 
@@ -482,6 +548,8 @@ class MetaComponent(BASE.MetaDag):
 
         # Bind exclusive data
         self._containerFn = om2.MFnContainerNode(self._node)
+        self._memberSetCache = None
+        self._pathTemplates = {}
 
         # Add component tag
         if node is None:
@@ -515,6 +583,7 @@ class MetaComponent(BASE.MetaDag):
         super(MetaComponent, self)._updateExclusiveData()
 
         self._containerFn = om2.MFnContainerNode(self._node)
+        self._pathTemplates = {}
 
     def _setupDirectory(self):
         """Create a directory structure for a new component type upon exporting or assetising a component for the first time.
@@ -594,6 +663,148 @@ class MetaComponent(BASE.MetaDag):
                 memberCategories.remove(memberCategory)
                 memberCategoryCacheAttr.set(memberCategories)
 
+    def _selectNodes(self, nodes, addFirst=False, add=False):
+        """Add nodes to or replace the active selection list.
+        Used by the selection methods and by the export methods which require a single selection of this component and its members.
+
+        Nodes are added directly to an :class:`OpenMaya.MSelectionList` to avoid resolving their names via :func:`cmds.select`.
+        """
+        selection = om2.MSelectionList()
+
+        for node in nodes:
+            selection.add(node)
+
+        if addFirst:
+            listAdjustment = om2.MGlobal.kAddToHeadOfList
+        elif add:
+            listAdjustment = om2.MGlobal.kAddToList
+        else:
+            listAdjustment = om2.MGlobal.kReplaceList
+
+        om2.MGlobal.setActiveSelectionList(selection, listAdjustment=listAdjustment)
+
+    def _firstParent(self):
+        """Return the first parent of the encapsulated dagContainer node.
+        Queries the parent directly instead of constructing a parent iterator when only the first parent is required.
+        """
+        return self._nodeFn.parent(0)
+
+    def _getPathTemplate(self, pathNamingConvention):
+        """Return a callable which formats a path naming convention from a ``fileName`` keyword.
+        The component path is resolved on each call so that changes to :attr:`COMPONENT_PATH_ENVIRONMENT_VARIABLE` are respected.
+        Callables are cached per naming convention and component path, with both fields and the :attr:`componentType` bound.
+        """
+        componentPath = self.getComponentPath()
+        try:
+            return self._pathTemplates[pathNamingConvention, componentPath]
+        except KeyError:
+            pathTemplate = self._pathTemplates[pathNamingConvention, componentPath] = functools.partial(
+                pathNamingConvention.format, componentPath=componentPath, componentType=self.componentType)
+            return pathTemplate
+
+    def _listRegisteredScripts(self):
+        """Return the script identifiers registered with the encapsulated dagContainer node which correspond to an existing script file.
+        Reads the script registry once, providing an alternative to calling :meth:`hasScript` for each identifier.
+        """
+        scriptPathTemplate = self._getPathTemplate(self.SCRIPT_PATH_NAMING_CONVENTION)
+        return [scriptId for scriptId, fileName in self.scriptRegistry.get().iteritems() if os.path.exists(scriptPathTemplate(fileName=fileName))]
+
+    def _setMetadata(self, metadata):
+        """Set the values of multiple metadata plugs on the encapsulated dagContainer node via a single undoable modifier.
+        Returns a mapping of each plug name to its previous value so that changes can be reverted.
+        """
+        previousMetadata = {}
+        dgMod = OM.MDGModifier()
+
+        for attrName, value in metadata.iteritems():
+            plug = self.getPlug(attrName)
+            previousMetadata[attrName] = self.getPlug(attrName, asMeta=True).get()
+
+            if isinstance(value, bool):
+                dgMod.newPlugValueBool(plug, value)
+            elif isinstance(value, int):
+                dgMod.newPlugValueInt(plug, value)
+            else:
+                dgMod.newPlugValueString(plug, value)
+
+        dgMod.doIt()
+
+        return previousMetadata
+
+    def _walkAncestors(self):
+        """Yield each ancestor of the encapsulated dagContainer node along with its `mType`, starting from the first parent.
+        Iteration stops upon reaching the world or an ancestor which is not tagged with an `mType`.
+        Used by :meth:`getModule` and :meth:`getRig` to share a single walk of the ancestral hierarchy.
+        """
+        parent = self._firstParent()
+
+        while not parent.hasFn(om2.MFn.kWorld):
+            try:
+                mType = BASE.getMTypeFromNode(parent)
+            except EXC.MayaLookupError:
+                return
+
+            yield parent, mType
+
+            parent = om2.MFnDagNode(parent).parent(0)
+
+    @contextlib.contextmanager
+    def _memberCache(self):
+        """Context manager which caches member maps retrieved via :meth:`_getMemberMapByCategory` for the duration of the context.
+        Used by operations such as :meth:`inspect` and :meth:`assetise` which repeatedly query the same member categories.
+
+        Nested contexts share the cache of the outermost context.
+        """
+        if self._memberSetCache is not None:
+            yield self._memberSetCache
+            return
+
+        self._memberSetCache = {}
+
+        try:
+            yield self._memberSetCache
+        finally:
+            self._memberSetCache = None
+
+    @staticmethod
+    def _mapNodes(nodes):
+        """Return an :class:`collections.OrderedDict` mapping the :class:`OpenMaya.MObjectHandle` hash code of each unique node to its :class:`OpenMaya.MObject` wrapper.
+        Provides constant time membership testing for nodes whilst preserving their order.
+        """
+        return collections.OrderedDict((om2.MObjectHandle(node).hashCode(), node) for node in nodes)
+
+    def _getMemberMapByCategory(self, memberCategory):
+        """Return an :class:`collections.OrderedDict` mapping the :class:`OpenMaya.MObjectHandle` hash code of each member of a given member category to its :class:`OpenMaya.MObject` wrapper.
+        If called within a :meth:`_memberCache` context, the map is compiled once and reused.
+        """
+        if self._memberSetCache is None:
+            return self._mapNodes(self.iterMembersByCategory(memberCategory))
+
+        try:
+            return self._memberSetCache[memberCategory]
+        except KeyError:
+            memberMap = self._memberSetCache[memberCategory] = self._mapNodes(self.iterMembersByCategory(memberCategory))
+            return memberMap
+
+    def _iterConnectedComponents(self, memberCategory, directionType, asMeta=False):
+        """Yield unique components which are directly connected to members of a given member category.
+        Called exclusively by :meth:`iterInputComponents` and :meth:`iterOutputComponents`.
+        """
+        seenComponentHashCodes = set()
+
+        for member in self.iterMembersByCategory(memberCategory):
+            for connectedNode in DG.iterDependenciesByNode(member, directionType=directionType, walk=False):
+                try:
+                    componentNode = getComponentFromMember(connectedNode, asMeta=False)
+                except RuntimeError:
+                    continue
+
+                componentHashCode = om2.MObjectHandle(componentNode).hashCode()
+
+                if componentHashCode not in seenComponentHashCodes:
+                    seenComponentHashCodes.add(componentHashCode)
+                    yield BASE.getMNode(componentNode) if asMeta else componentNode
+
     # --- Public : File System ----------------------------------------------------------------------------
 
     @classmethod
@@ -816,7 +1027,7 @@ class MetaComponent(BASE.MetaDag):
 
         if fileName:
             pathConvention = MetaComponent.ASSET_PATH_NAMING_CONVENTION if self.isAsset else MetaComponent.WIP_PATH_NAMING_CONVENTION
-            filePath = pathConvention.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+            filePath = self._getPathTemplate(pathConvention)(fileName=fileName)
             return os.path.abspath(filePath)
         else:
             return ""
@@ -849,7 +1060,7 @@ class MetaComponent(BASE.MetaDag):
         except KeyError:
             return False
         else:
-            filePath = self.SCRIPT_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+            filePath = self._getPathTemplate(self.SCRIPT_PATH_NAMING_CONVENTION)(fileName=fileName)
 
             return os.path.exists(filePath)
 
@@ -867,7 +1078,7 @@ class MetaComponent(BASE.MetaDag):
         Raises:
             :exc:`~exceptions.ValueError`: If the ``fileName`` does not correspond to an existing script file within the script sub-directory of the :attr:`componentTypePath`.
         """
-        filePath = self.SCRIPT_PATH_NAMING_CONVENTION.format(componentType=self.componentType, fileName=fileName)
+        filePath = self._getPathTemplate(self.SCRIPT_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         if not os.path.exists(filePath):
             raise ValueError("Script file does not exist: {}".format(filePath))
@@ -875,7 +1086,7 @@ class MetaComponent(BASE.MetaDag):
         scriptMap = self.scriptRegistry.get()
 
         if scriptId in scriptMap:
-            log.info("Overriding registered `{}` script for mNode: {!r}".format(scriptId, self))
+            log.info("Overriding registered `%s` script for mNode: %r", scriptId, self)
 
         scriptMap[scriptId] = fileName
         self.scriptRegistry.set(scriptMap)
@@ -914,7 +1125,7 @@ class MetaComponent(BASE.MetaDag):
         """
         scriptMap = self.scriptRegistry.get()
         fileName = scriptMap[scriptId]
-        filePath = self.SCRIPT_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+        filePath = self._getPathTemplate(self.SCRIPT_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         script = imp.load_source("{}.scripts.{}".format(self.componentType, fileName), filePath)
         return getattr(script, scriptId)(self, *args, **kwargs)
@@ -1120,17 +1331,13 @@ class MetaComponent(BASE.MetaDag):
         if self.isGuided:
             self.toggleGuide()
 
-        # Disconnect inputs and remaining message outputs
-        guideMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Guide))
+        # Disconnect inputs and remaining message outputs (edges are collected before any are disconnected)
+        guideMembers = self._getMemberMapByCategory(self.MemberCategoryPreset.Guide).values()
+        externalEdges = DG.getDirectEdges(guideMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=guideMembers)
+        externalEdges.extend(DG.getDirectEdges(guideMembers, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=guideMembers))
 
-        for guideMember in guideMembers:
-            for (sourcePlug, destPlug) in DG.iterDependenciesByEdge(guideMember, directionType=om2.MItDependencyGraph.kDownstream, walk=False):
-                if destPlug.node() not in guideMembers:
-                    PLUG.disconnect(sourcePlug, destPlug, forceLocked=True)
-
-            for (sourcePlug, destPlug) in DG.iterDependenciesByEdge(guideMember, directionType=om2.MItDependencyGraph.kUpstream, walk=False):
-                if sourcePlug.node() not in guideMembers:
-                    PLUG.disconnect(sourcePlug, destPlug, forceLocked=True)
+        for (sourcePlug, destPlug) in externalEdges:
+            PLUG.disconnect(sourcePlug, destPlug, forceLocked=True)
 
         # Delete guide
         self.selectMembersByCategory(self.MemberCategoryPreset.Guide)
@@ -1158,7 +1365,7 @@ class MetaComponent(BASE.MetaDag):
 
         # Import guide
         fileName = MetaComponent.GUIDE_FILE_NAMING_CONVENTION.format(componentType=self.componentType, majorVersion=self.majorVersion)
-        filePath = MetaComponent.GUIDE_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+        filePath = self._getPathTemplate(MetaComponent.GUIDE_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         try:
             rig = self.getRig(asMeta=True)
@@ -1196,7 +1403,7 @@ class MetaComponent(BASE.MetaDag):
 
         # Load guide data and use to reconnect the guide
         fileName = MetaComponent.GUIDE_DATA_FILE_NAMING_CONVENTION.format(componentType=self.componentType, majorVersion=self.majorVersion)
-        filePath = MetaComponent.GUIDE_DATA_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+        filePath = self._getPathTemplate(MetaComponent.GUIDE_DATA_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         with open(filePath, 'r') as f:
             guideData = json.load(f)
@@ -1255,18 +1462,16 @@ class MetaComponent(BASE.MetaDag):
             guideSourceAttr = ATTR.createMessageAttribute(longName="guideSource")
             guidedDestAttr = ATTR.createMessageAttribute(longName="guidedDest")
             guideCacheAttr = guidedParametersGroup.addCompoundAttribute((guideSourceAttr, guidedDestAttr), longName="guideCache", resultAsMeta=True, array=True)
-            log.info("{}: Component guide tracking plug created".format(guideCacheAttr.partialName))
+            log.info("%s: Component guide tracking plug created", guideCacheAttr.partialName)
 
         guideCachePacked = guideCacheAttr.getPackedCompound()
         guideCachePacked.clear()
 
-        guideMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Guide))
-        guidedMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Guided))
+        guideMembers = self.iterMembersByCategory(self.MemberCategoryPreset.Guide)
+        guidedMembers = self.iterMembersByCategory(self.MemberCategoryPreset.Guided)
 
-        for guideMember in guideMembers:
-            for sourcePlug, destPlug in DG.iterDependenciesByEdge(guideMember, directionType=om2.MItDependencyGraph.kDownstream, walk=False):
-                if destPlug.node() in guidedMembers:
-                    guideCachePacked.append((sourcePlug, destPlug))
+        for sourcePlug, destPlug in DG.getDirectEdges(guideMembers, directionType=om2.MItDependencyGraph.kDownstream, includeNodes=guidedMembers):
+            guideCachePacked.append((sourcePlug, destPlug))
 
         return guideCachePacked
 
@@ -1328,10 +1533,10 @@ class MetaComponent(BASE.MetaDag):
         hierarchyName = self.HIERARCHY_GROUP_NAMING_CONVENTION.format(memberCategory=memberCategory)
         hierarchyNode = self.getChildByName(hierarchyName)
 
-        if memberType is MetaComponent.MemberType.Hierarchy:
+        if memberType is self._HIERARCHY:
             return BASE.getMNode(hierarchyNode) if asMeta else hierarchyNode
         else:
-            namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is MetaComponent.MemberType.Settings else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
+            namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is self._SETTINGS else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
             memberNodeName = namingConvention.format(memberCategory=memberCategory)
             member = DAG.getChildByName(hierarchyNode, memberNodeName)
             return BASE.getMNode(member) if asMeta else member
@@ -1412,11 +1617,11 @@ class MetaComponent(BASE.MetaDag):
             if om2.MFnDependencyNode(hierarchyNode).typeId != self.HIERACHY_GROUP_TYPE_ID:
                 raise EXC.MayaTypeError("{}: Component child is not a hierarchy group".format(NAME.getNodeFullName(hierarchyNode)))
 
-            if memberType == MetaComponent.MemberType.Hierarchy:
+            if memberType is self._HIERARCHY:
                 yield BASE.getMNode(hierarchyNode) if asMeta else hierarchyNode
             else:
                 memberCategory = NAME.getNodeShortName(hierarchyNode)
-                namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is MetaComponent.MemberType.Settings else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
+                namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is self._SETTINGS else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
                 memberNodeName = namingConvention.format(memberCategory=memberCategory)
 
                 try:
@@ -1441,15 +1646,7 @@ class MetaComponent(BASE.MetaDag):
         if addFirst and add:
             raise ValueError("Choose either to add node to head or tail of the active selection")
 
-        members = list(self.iterMembers())
-        memberNames = [NAME.getNodePartialName(member) for member in members]
-
-        if addFirst:
-            cmds.select(memberNames, addFirst=addFirst)
-        elif add:
-            cmds.select(memberNames, add=add)
-        else:
-            cmds.select(memberNames)
+        self._selectNodes(self.iterMembers(), addFirst=addFirst, add=add)
 
     def selectMembersByCategory(self, memberCategory, addFirst=False, add=False):
         """Select members of this component by member category, adding to or replacing the active selection list.
@@ -1467,15 +1664,7 @@ class MetaComponent(BASE.MetaDag):
         if addFirst and add:
             raise ValueError("Choose either to add node to head or tail of the active selection")
 
-        members = list(self.iterMembersByCategory(memberCategory))
-        memberNames = [NAME.getNodePartialName(member) for member in members]
-
-        if addFirst:
-            cmds.select(memberNames, addFirst=addFirst)
-        elif add:
-            cmds.select(memberNames, add=add)
-        else:
-            cmds.select(memberNames)
+        self._selectNodes(self.iterMembersByCategory(memberCategory), addFirst=addFirst, add=add)
 
     def selectMembersByType(self, memberType, addFirst=False, add=False):
         """Select members of this component by member type, adding to or replacing the active selection list.
@@ -1493,15 +1682,7 @@ class MetaComponent(BASE.MetaDag):
         if addFirst and add:
             raise ValueError("Choose either to add node to head or tail of the active selection")
 
-        members = list(self.iterMembersByType(memberType))
-        memberNames = [NAME.getNodePartialName(member) for member in members]
-
-        if addFirst:
-            cmds.select(memberNames, addFirst=addFirst)
-        elif add:
-            cmds.select(memberNames, add=add)
-        else:
-            cmds.select(memberNames)
+        self._selectNodes(self.iterMembersByType(memberType), addFirst=addFirst, add=add)
 
     def createMemberByType(self, memberCategory, memberType, resultAsMeta=False):
         """Create a member for a given member category and member type.
@@ -1520,7 +1701,7 @@ class MetaComponent(BASE.MetaDag):
         Returns:
             :class:`OpenMaya.MObject` | T <= :class:`msTools.metadata.systems.mrs.Meta`: Wrapper or `mNode` encapsulation of the new component member node. Type is determined by ``asMeta``.
         """
-        if memberType == MetaComponent.MemberType.Hierarchy:
+        if memberType is self._HIERARCHY:
             hierarchyName = self.HIERARCHY_GROUP_NAMING_CONVENTION.format(memberCategory=memberCategory)
 
             try:
@@ -1543,7 +1724,7 @@ class MetaComponent(BASE.MetaDag):
             if om2.MFnDependencyNode(hierarchyNode).typeId != self.HIERACHY_GROUP_TYPE_ID:
                 raise EXC.MayaTypeError("{}: Component child is not a hierarchy group".format(NAME.getNodeFullName(hierarchyNode)))
 
-            namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is MetaComponent.MemberType.Settings else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
+            namingConvention = self.SETTINGS_GROUP_NAMING_CONVENTION if memberType is self._SETTINGS else MetaComponent.PARAMETERS_GROUP_NAMING_CONVENTION
             nodeName = namingConvention.format(memberCategory=memberCategory)
 
             try:
@@ -1641,7 +1822,8 @@ class MetaComponent(BASE.MetaDag):
         Returns:
             :class:`bool`: The logical conjunction of :meth:`inspectHierarchy`, :meth:`inspectRegistration`, :meth:`inspectNaming`, :meth:`inspectEncapsulation`, :meth:`inspectGuide` and :meth:`inspectScripts`.
         """
-        return self.inspectHierarchy() and self.inspectRegistration() and self.inspectNaming() and self.inspectEncapsulation() and self.inspectGuide() and self.inspectScripts()
+        with self._memberCache():
+            return self.inspectHierarchy() and self.inspectRegistration() and self.inspectNaming() and self.inspectEncapsulation() and self.inspectGuide() and self.inspectScripts()
 
     def inspectHierarchy(self):
         """Inspect the DAG hierarchy structure of this component.
@@ -1655,11 +1837,11 @@ class MetaComponent(BASE.MetaDag):
 
         for child in self.iterChildren():
             if om2.MFnDependencyNode(child).typeId != MetaComponent.HIERACHY_GROUP_TYPE_ID:
-                log.warning("{}: Component child is not a hierarchy group".format(NAME.getNodeFullName(child)))
+                log.warning("%s: Component child is not a hierarchy group", NAME.getNodeFullName(child))
                 hasValidHierarchy = False
 
         if hasValidHierarchy:
-            log.info("{!r}: Component has valid hierarchy".format(self))
+            log.info("%r: Component has valid hierarchy", self)
 
         return hasValidHierarchy
 
@@ -1688,11 +1870,11 @@ class MetaComponent(BASE.MetaDag):
                         if memberMessageDestAttrName in memberCategoryAttrNames:
                             break
                 else:
-                    log.warning("{}: Component (non-DAG) member is not registered to a member category".format(NAME.getNodeFullName(member)))
+                    log.warning("%s: Component (non-DAG) member is not registered to a member category", NAME.getNodeFullName(member))
                     hasValidRegistration = False
 
         if hasValidRegistration:
-            log.info("{!r}: Component has valid member registration".format(self))
+            log.info("%r: Component has valid member registration", self)
 
         return hasValidRegistration
 
@@ -1708,21 +1890,28 @@ class MetaComponent(BASE.MetaDag):
         """
         hasValidNaming = True
         componentId = self.componentId
-        componentName = MetaComponent.COMPONENT_NAMING_CONVENTION.format(componentId=self.componentId)
+        componentName = MetaComponent.COMPONENT_NAMING_CONVENTION.format(componentId=componentId)
 
         if self.shortName != componentName:
-            log.warning("{}: Component name must follow `COMPONENT_NAMING_CONVENTION`: {}".format(self.shortName, componentName))
+            log.warning("%s: Component name must follow `COMPONENT_NAMING_CONVENTION`: %s", self.shortName, componentName)
             hasValidNaming = False
 
+        # Hierarchy groups are exempt from the member naming convention
+        childHashCodes = {om2.MObjectHandle(child).hashCode() for child in self.iterChildren()}
+
         for member in self.iterMembers():
-            memberName = NAME.getNodeShortName(member)
+            # Most members are expected to be valid, only resolve the full name when a warning is required
+            if NAME.getNodeShortName(member).startswith(componentId):
+                continue
 
-            if not memberName.startswith(componentId) and not self.hasChild(member):
-                log.warning("{}: Component member name must start with `componentId`: {}".format(NAME.getNodeFullName(member), self.componentId))
-                hasValidNaming = False
+            if om2.MObjectHandle(member).hashCode() in childHashCodes:
+                continue
+
+            log.warning("%s: Component member name must start with `componentId`: %s", NAME.getNodeFullName(member), componentId)
+            hasValidNaming = False
 
         if hasValidNaming:
-            log.info("{!r}: Component has valid naming".format(self))
+            log.info("%r: Component has valid naming", self)
 
         return hasValidNaming
 
@@ -1737,27 +1926,31 @@ class MetaComponent(BASE.MetaDag):
             :class:`bool`: :data:`True` if this component has a valid input and output structure, otherwise :data:`False`.
         """
         hasValidEncapsulation = True
-        members = list(self.iterMembers())
-        inputMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Input))
-        outputMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Output))
+        memberMap = self._mapNodes(self.iterMembers())
+        members = memberMap.values()
+        inputMemberMap = self._getMemberMapByCategory(self.MemberCategoryPreset.Input)
+        outputMemberMap = self._getMemberMapByCategory(self.MemberCategoryPreset.Output)
 
-        for member in members:
-            if member not in inputMembers:
-                for sourcePlug, destPlug in DG.iterDependenciesByEdge(member, directionType=om2.MItDependencyGraph.kUpstream, walk=False):
-                    if sourcePlug.node() not in members:
-                        log.warning("{}: Component (non-input) member has an upstream dependency that breaks component encapsulation: {} -> {}".format(
-                            NAME.getNodeFullName(member), NAME.getPlugPartialName(sourcePlug), NAME.getPlugPartialName(destPlug)))
-                        hasValidEncapsulation = False
-
-            if member not in outputMembers:
-                for sourcePlug, destPlug in DG.iterDependenciesByEdge(member, directionType=om2.MItDependencyGraph.kDownstream, walk=False):
-                    if destPlug.node() not in members:
-                        log.warning("{}: Component (non-output) member has a downstream dependency that breaks component encapsulation: {} -> {}".format(
-                            NAME.getNodeFullName(member), NAME.getPlugPartialName(sourcePlug), NAME.getPlugPartialName(destPlug)))
-                        hasValidEncapsulation = False
+        nonInputMembers = [member for hashCode, member in memberMap.iteritems() if hashCode not in inputMemberMap]
+        nonOutputMembers = [member for hashCode, member in memberMap.iteritems() if hashCode not in outputMemberMap]
+
+        getNodeName = _cachedNodeNamer(NAME.getNodeFullName)
+        getPlugName = _cachedPlugNamer()
+
+        for sourcePlug, destPlug in DG.getDirectEdges(nonInputMembers, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=members):
+            if log.isEnabledFor(logging.WARNING):
+                log.warning("%s: Component (non-input) member has an upstream dependency that breaks component encapsulation: %s -> %s",
+                            getNodeName(destPlug.node()), getPlugName(sourcePlug), getPlugName(destPlug))
+            hasValidEncapsulation = False
+
+        for sourcePlug, destPlug in DG.getDirectEdges(nonOutputMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=members):
+            if log.isEnabledFor(logging.WARNING):
+                log.warning("%s: Component (non-output) member has a downstream dependency that breaks component encapsulation: %s -> %s",
+                            getNodeName(sourcePlug.node()), getPlugName(sourcePlug), getPlugName(destPlug))
+            hasValidEncapsulation = False
 
         if hasValidEncapsulation:
-            log.info("{!r}: Component has valid encapsulation".format(self))
+            log.info("%r: Component has valid encapsulation", self)
 
         return hasValidEncapsulation
 
@@ -1765,7 +1958,7 @@ class MetaComponent(BASE.MetaDag):
         hasValidGuide = True
 
         if not self.isGuidable:
-            log.info("{!r}: Component does not have a guide".format(self))
+            log.info("%r: Component does not have a guide", self)
             return hasValidGuide
 
         guidedParametersGroup = self.getMemberByType(self.MemberCategoryPreset.Guided, self.MemberType.Parameters)
@@ -1774,7 +1967,7 @@ class MetaComponent(BASE.MetaDag):
             guideCacheAttr = guidedParametersGroup.guideCache
         except EXC.MayaLookupError:
             if not self.isGuided:
-                log.warning("{!r}: Component is unguided but is not tracking guided connections, manual reguiding may be required".format(self))
+                log.warning("%r: Component is unguided but is not tracking guided connections, manual reguiding may be required", self)
                 hasValidGuide = False
         else:
             if not self.isGuided:
@@ -1782,101 +1975,71 @@ class MetaComponent(BASE.MetaDag):
 
                 for (guideSourceElementPlug, guidedDestElementPlug) in guideCachePacked.getChildPlugGroups():
                     if not guideSourceElementPlug.isDestination or not guidedDestElementPlug.isDestination:
-                        log.warning("{!r}: Component is unguided but has malformed tracking of guided connections, manual reguiding may be required".format(self))
+                        log.warning("%r: Component is unguided but has malformed tracking of guided connections, manual reguiding may be required", self)
                         hasValidGuide = False
 
-        guideMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Guide))
-        guidedMembers = list(self.iterMembersByCategory(self.MemberCategoryPreset.Guided))
+        guideMembers = self._getMemberMapByCategory(self.MemberCategoryPreset.Guide).values()
+        guidedMembers = self._getMemberMapByCategory(self.MemberCategoryPreset.Guided).values()
+
+        getNodeName = _cachedNodeNamer(NAME.getNodeFullName)
+        getPlugName = _cachedPlugNamer()
 
-        for guideMember in guideMembers:
-            for sourcePlug, destPlug in DG.iterDependenciesByEdge(guideMember, directionType=om2.MItDependencyGraph.kDownstream, walk=False):
-                if destPlug.node() not in guideMembers and destPlug.node() not in guidedMembers:
-                    log.warning("{}: Component guide member has a downstream dependency that breaks guide conventions: {} -> {}".format(
-                        NAME.getNodeFullName(guideMember), NAME.getPlugPartialName(sourcePlug), NAME.getPlugPartialName(destPlug)))
-                    hasValidGuide = False
+        # Members without connected source plugs do not contribute any edges
+        for sourcePlug, destPlug in DG.getDirectEdges(guideMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=itertools.chain(guideMembers, guidedMembers)):
+            if log.isEnabledFor(logging.WARNING):
+                log.warning("%s: Component guide member has a downstream dependency that breaks guide conventions: %s -> %s",
+                            getNodeName(sourcePlug.node()), getPlugName(sourcePlug), getPlugName(destPlug))
+            hasValidGuide = False
 
         if hasValidGuide:
-            log.info("{!r}: Component has valid guide".format(self))
+            log.info("%r: Component has valid guide", self)
 
         return hasValidGuide
 
     def inspectScripts(self):
         hasValidScripts = True
-        scriptIds = self.scriptIds.get()
+        scriptIds = sorted(self.scriptRegistry.get())
 
         if not scriptIds:
-            log.info("{!r}: Component does not have any registered scripts".format(self))
+            log.info("%r: Component does not have any registered scripts", self)
             return hasValidScripts
 
-        for scriptId in self.scriptIds.get():
-            if not self.hasScript(scriptId):
-                log.warning("{}: Registered `scriptId` does not correspond to an existing script".format(scriptId))
-                hasValidScripts = False
+        existingScriptIds = set(self._listRegisteredScripts())
+        missingScriptIds = [scriptId for scriptId in scriptIds if scriptId not in existingScriptIds]
+
+        for scriptId in missingScriptIds:
+            log.warning("%s: Registered `scriptId` does not correspond to an existing script", scriptId)
+            hasValidScripts = False
 
         if hasValidScripts:
-            log.info("{!r}: Component has valid scripts for following registered `scriptIds`: {}".format(self, scriptIds))
+            log.info("%r: Component has valid scripts for following registered `scriptIds`: %s", self, scriptIds)
 
         return hasValidScripts
 
     # --- Public : Extrospect ----------------------------------------------------------------------------
 
     def iterInputComponents(self, asMeta=False):
-        seenComponentNodes = OM.MObjectSet()
-
-        for inputMember in self.iterMembersByCategory(self.MemberCategoryPreset.Input):
-            for sourceNode in DG.iterDependenciesByNode(inputMember, directionType=om2.MItDependencyGraph.kUpstream, walk=False):
-                try:
-                    componentNode = getComponentFromMember(sourceNode, asMeta=False)
-                except RuntimeError:
-                    continue
-
-                if seenComponentNodes.add(componentNode):
-                    yield BASE.getMNode(componentNode) if asMeta else componentNode
+        return self._iterConnectedComponents(self.MemberCategoryPreset.Input, om2.MItDependencyGraph.kUpstream, asMeta=asMeta)
 
     def iterOutputComponents(self, asMeta=False):
-        seenComponentNodes = OM.MObjectSet()
-
-        for inputMember in self.iterMembersByCategory(self.MemberCategoryPreset.Input):
-            for sourceNode in DG.iterDependenciesByNode(inputMember, directionType=om2.MItDependencyGraph.kUpstream, walk=False):
-                try:
-                    componentNode = getComponentFromMember(sourceNode, asMeta=False)
-                except RuntimeError:
-                    continue
-
-                if seenComponentNodes.add(componentNode):
-                    yield BASE.getMNode(componentNode) if asMeta else componentNode
+        return self._iterConnectedComponents(self.MemberCategoryPreset.Output, om2.MItDependencyGraph.kDownstream, asMeta=asMeta)
 
     def getModule(self, asMeta=False):
-        try:
-            parent = self.getParent()
-        except RuntimeError:
-            raise RuntimeError("{!r}: Component is not part of a module".format(self))
+        for parent, mType in self._walkAncestors():
+            if issubclass(mType, MetaModule):
+                return mType(parent) if asMeta else parent
 
-        try:
-            mType = BASE.getMTypeFromNode(parent)
-        except EXC.MayaLookupError:
-            raise RuntimeError("{!r}: Component is not part of a module".format(self))
-
-        if issubclass(mType, MetaModule):
-            return mType(parent) if asMeta else parent
+            # A component must be parented directly under its module
+            break
 
         raise RuntimeError("{!r}: Component is not part of a module".format(self))
 
     def getRig(self, asMeta=False):
-        try:
-            parent = self.getParent()
-        except RuntimeError:
-            raise RuntimeError("{!r}: Component is not part of a rig".format(self))
-
-        try:
-            mType = BASE.getMTypeFromNode(parent)
-        except EXC.MayaLookupError:
-            raise RuntimeError("{!r}: Component is not part of a rig".format(self))
-
-        if issubclass(mType, MetaModule):
-            return mType(parent).getRig(asMeta=asMeta)
-        elif issubclass(mType, MetaRig):
-            return mType(parent) if asMeta else parent
+        for parent, mType in self._walkAncestors():
+            if issubclass(mType, MetaRig):
+                return mType(parent) if asMeta else parent
+            elif not issubclass(mType, MetaModule):
+                break
 
         raise RuntimeError("{!r}: Component is not part of a rig".format(self))
 
@@ -1888,40 +2051,44 @@ class MetaComponent(BASE.MetaDag):
 
         if self.isInstanced:
             raise RuntimeError("{!r}: Instanced component cannot be exported".format(self))
-        elif not self.iterParents().next().hasFn(om2.MFn.kWorld):
+        elif not self._firstParent().hasFn(om2.MFn.kWorld):
             raise RuntimeError("{!r}: Parented component cannot be exported".format(self))
 
         if not self.inspect():
-            log.warning("{!r}: Component has issues that must be fixed before assetisation, see warning log for details".format(self))
+            log.warning("%r: Component has issues that must be fixed before assetisation, see warning log for details", self)
 
         # Create component type directory for initial export
         self._setupDirectory()
 
-        self.creationDate = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        componentType = self.componentType
+        majorVersion = self.majorVersion
+        minorVersion = self.minorVersion
+
+        self.creationDate = _timestamp()
 
         # Do not increment for initial export
         if increment and self.fileName:
-            self.minorVersion = self.minorVersion + 1
+            minorVersion += 1
+            self.minorVersion = minorVersion
 
         if author:
             self.author = author
         elif not self.author:
-            self.author = getpass.getuser()
+            self.author = _DEFAULT_AUTHOR
 
         # Assign default modification
         if not modification:
-            modification = "new" if self.minorVersion == 0 else "update"
+            modification = "new" if minorVersion == 0 else "update"
 
         fileName = MetaComponent.WIP_FILE_NAMING_CONVENTION.format(
-            componentType=self.componentType, majorVersion=self.majorVersion, minorVersion=self.minorVersion, modification=modification)
-        filePath = MetaComponent.WIP_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+            componentType=componentType, majorVersion=majorVersion, minorVersion=minorVersion, modification=modification)
+        filePath = self._getPathTemplate(MetaComponent.WIP_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         self.fileName = fileName
 
         # Export component (force overriding existing files only when `increment` is false)
-        self.selectMembers()
-        self.select(add=True)
-        cmds.file(exportSelected=filePath, type="mayaAscii", preserveReferences=True, force=not increment)
+        self._selectNodes(itertools.chain(self.iterMembers(), (self._node,)))
+        _exportSelected(filePath, force=not increment)
 
         # Export Node Editor tab data
 
@@ -1933,89 +2100,97 @@ class MetaComponent(BASE.MetaDag):
 
         if self.isInstanced:
             raise RuntimeError("{!r}: Instanced component cannot be assetised".format(self))
-        elif not self.iterParents().next().hasFn(om2.MFn.kWorld):
+        elif not self._firstParent().hasFn(om2.MFn.kWorld):
             raise RuntimeError("{!r}: Parented component cannot be assetised".format(self))
 
         if self.absoluteNamespace != ":":
             raise RuntimeError("{!r}: Component must be within the root namespace for assetisation")
 
-        if not self.inspect():
-            raise RuntimeError("{!r}: Component has issues that must be fixed before assetisation, see warning log for details".format(self))
+        # Member sets are shared between inspection and the export of guide data
+        with self._memberCache():
+            if not self.inspect():
+                raise RuntimeError("{!r}: Component has issues that must be fixed before assetisation, see warning log for details".format(self))
 
-        # Ensure component type directory exists in case user never exported
-        self._setupDirectory()
+            # Ensure component type directory exists in case user never exported
+            self._setupDirectory()
 
-        self.isAsset = True
-        self.minorVersion = 0
-        self.creationDate = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+            componentType = self.componentType
+            majorVersion = self.majorVersion
 
-        if author:
-            self.author = author
-        elif not self.author:
-            self.author = getpass.getuser()
+            if self.isGuidable:
+                if self.isGuided:
+                    # Guide tracking is baked once a component is assetised so we must ensure it is current
+                    # The packed cache is reused when exporting guide data instead of being packed again
+                    guideCachePacked = self.updateGuideTracking()
 
-        if self.isGuidable:
-            if self.isGuided:
-                # Guide tracking is baked once a component is assetised so we must ensure it is current
-                self.updateGuideTracking()
+                    # Materialise members once for selection and edge testing
+                    inputMembers = self._getMemberMapByCategory(self.MemberCategoryPreset.Input).values()
+                    guideMembers = self._getMemberMapByCategory(self.MemberCategoryPreset.Guide).values()
 
-                # Export the guide for requiding
-                fileName = MetaComponent.GUIDE_FILE_NAMING_CONVENTION.format(componentType=self.componentType, majorVersion=self.majorVersion)
-                filePath = MetaComponent.GUIDE_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+                    # Export the guide for requiding
+                    fileName = MetaComponent.GUIDE_FILE_NAMING_CONVENTION.format(componentType=componentType, majorVersion=majorVersion)
+                    filePath = self._getPathTemplate(MetaComponent.GUIDE_PATH_NAMING_CONVENTION)(fileName=fileName)
 
-                self.selectMembersByCategory(self.MemberCategoryPreset.Guide)
-                guideGroup = self.getMemberByType(self.MemberCategoryPreset.Guide, self.MemberType.Hierarchy, asMeta=True)
+                    self._selectNodes(guideMembers)
+                    guideGroup = self.getMemberByType(self.MemberCategoryPreset.Guide, self.MemberType.Hierarchy, asMeta=True)
 
-                guideGroup.relativeReparent()
-                cmds.file(exportSelected=filePath, type="mayaAscii", preserveReferences=True)
-                guideGroup.relativeReparent(parent=self._node)
+                    guideGroup.relativeReparent()
+                    _exportSelected(filePath)
+                    guideGroup.relativeReparent(parent=self._node)
 
-                # Export guided connection data for reguiding
-                fileName = MetaComponent.GUIDE_DATA_FILE_NAMING_CONVENTION.format(componentType=self.componentType, majorVersion=self.majorVersion)
-                filePath = MetaComponent.GUIDE_DATA_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+                    # Export guided connection data for reguiding
+                    fileName = MetaComponent.GUIDE_DATA_FILE_NAMING_CONVENTION.format(componentType=componentType, majorVersion=majorVersion)
+                    filePath = self._getPathTemplate(MetaComponent.GUIDE_DATA_PATH_NAMING_CONVENTION)(fileName=fileName)
 
-                guideData = {"componentId": self.componentId, "inputEdges": [], "outputEdges": []}
+                    # Input -> Guide connections
+                    getPlugName = _cachedPlugNamer(useFullNames=True)
+                    inputEdges = [(getPlugName(sourcePlug), getPlugName(destPlug))
+                                  for sourcePlug, destPlug in DG.getDirectEdges(inputMembers, directionType=om2.MItDependencyGraph.kDownstream, includeNodes=guideMembers)]
 
-                # Input -> Guide connections
-                inputMembers = self.iterMembersByCategory(self.MemberCategoryPreset.Input)
-                guideMembers = self.iterMembersByCategory(self.MemberCategoryPreset.Guide)
+                    # Guide -> Guided connections
+                    outputEdges = [(getPlugName(guideSourcePlug), getPlugName(guidedDestPlug))
+                                   for guideSourcePlug, guidedDestPlug in guideCachePacked.getInputPlugGroups()]
 
-                for inputMember in inputMembers:
-                    for (inputSourcePlug, destPlug) in DG.iterDependenciesByEdge(inputMember, directionType=om2.MItDependencyGraph.kDownstream, walk=False):
-                        if destPlug.node() in guideMembers:
-                            guideData["inputEdges"].append((NAME.getPlugFullName(inputSourcePlug), NAME.getPlugFullName(destPlug)))
+                    guideData = {"componentId": self.componentId, "inputEdges": inputEdges, "outputEdges": outputEdges}
 
-                # Guide -> Guided connections
-                guidedParametersGroup = self.getMemberByType(self.MemberCategoryPreset.Guided, self.MemberType.Parameters, asMeta=True)
-                guideCacheAttr = guidedParametersGroup.guideCache
-                guideCachePacked = guideCacheAttr.getPackedCompound()
+                    with open(filePath, 'w') as f:
+                        json.dump(guideData, f, separators=(',', ':'))
+                else:
+                    raise RuntimeError("{!r}: Guidable component must be guided for assetisation to ensure expectations are consistent when importing".format(self))
 
-                for (guideSourcePlug, guidedDestPlug) in guideCachePacked.getInputPlugGroups():
-                    guideData["outputEdges"].append((NAME.getPlugFullName(guideSourcePlug), NAME.getPlugFullName(guidedDestPlug)))
+        # Export component
+        fileName = MetaComponent.ASSET_FILE_NAMING_CONVENTION.format(componentType=componentType, majorVersion=majorVersion)
+        filePath = self._getPathTemplate(MetaComponent.ASSET_PATH_NAMING_CONVENTION)(fileName=fileName)
 
-                with open(filePath, 'w') as f:
-                    json.dump(guideData, f)
-            else:
-                raise RuntimeError("{!r}: Guidable component must be guided for assetisation to ensure expectations are consistent when importing".format(self))
+        # Asset metadata must be exported with the component but should not persist if the export fails
+        metadata = {"isAsset": True, "minorVersion": 0, "creationDate": _timestamp(), "fileName": fileName}
 
-        # Export component
-        fileName = MetaComponent.ASSET_FILE_NAMING_CONVENTION.format(componentType=self.componentType, majorVersion=self.majorVersion)
-        filePath = MetaComponent.ASSET_PATH_NAMING_CONVENTION.format(componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+        if author:
+            metadata["creator"] = author
+        elif not self.author:
+            metadata["creator"] = _DEFAULT_AUTHOR
 
-        self.fileName = fileName
+        previousMetadata = self._setMetadata(metadata)
 
-        self.selectMembers()
-        self.select(add=True)
-        cmds.file(exportSelected=filePath, type="mayaAscii", preserveReferences=True)
+        try:
+            self._selectNodes(itertools.chain(self.iterMembers(), (self._node,)))
+            _exportSelected(filePath)
+        except StandardError:
+            self._setMetadata(previousMetadata)
+            raise
 
     def deassetise(self, author=None, modification=None):
         if not self.isAsset:
             raise RuntimeError("{!r}: Component is not assetised")
 
+        componentType = self.componentType
+        majorVersion = self.majorVersion + 1
+        minorVersion = 0
+
         self.isWip = True
-        self.majorVersion = self.majorVersion + 1
-        self.minorVersion = 0
-        self.creationDate = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        self.majorVersion = majorVersion
+        self.minorVersion = minorVersion
+        self.creationDate = _timestamp()
 
         if author:
             self.author = author
@@ -2025,16 +2200,14 @@ class MetaComponent(BASE.MetaDag):
             modification = "deassetised"
 
         fileName = MetaComponent.WIP_FILE_NAMING_CONVENTION.format(
-            componentType=self.componentType, majorVersion=self.majorVersion, minorVersion=self.minorVersion, modification=modification)
-        filePath = MetaComponent.WIP_PATH_NAMING_CONVENTION.format(
-            componentPath=self.getComponentPath(), componentType=self.componentType, fileName=fileName)
+            componentType=componentType, majorVersion=majorVersion, minorVersion=minorVersion, modification=modification)
+        filePath = self._getPathTemplate(MetaComponent.WIP_PATH_NAMING_CONVENTION)(fileName=fileName)
 
         self.fileName = fileName
 
         # Export component (force overriding existing files only when `increment` is false)
-        self.selectMembers()
-        self.select(add=True)
-        cmds.file(exportSelected=filePath, type="mayaAscii", preserveReferences=True)
+        self._selectNodes(itertools.chain(self.iterMembers(), (self._node,)))
+        _exportSelected(filePath)
 
     # --- Public : Delete ----------------------------------------------------------------------------
 
@@ -7,24 +7,167 @@ It represents the lowest level encapsulation of rig data which interface with ea
 
 --------------------------------
 """
-from datetime import datetime
-from collections import defaultdict
-import getpass
+from collections import namedtuple
+import contextlib
+import itertools
 import os
 import re
+import shutil
 import logging
 log = logging.getLogger(__name__)
 
 from maya.api import OpenMaya as om2
 
 from msTools.core.maya import dag_utils as DAG
+from msTools.core.maya import dg_utils as DG
 from msTools.core.maya import om_utils as OM
 from msTools.core.maya import name_utils as NAME
 from msTools.core.maya import decorator_utils as DECORATOR
 from msTools.metadata.systems import base as BASE
-from msTools.py.utils import path_utils as PY_PATH
 
-from enum import Enum
+from enum import IntEnum
+
+# Directory entries from scandir cache their type, avoiding a stat call per entry (Python 2 requires the scandir backport)
+try:
+    from os import scandir as _scandir
+except ImportError:
+    try:
+        from scandir import scandir as _scandir
+    except ImportError:
+        _scandir = None
+
+
+# ----------------------------------------------------------------------------
+# --- Globals ---
+# ----------------------------------------------------------------------------
+
+# Caches the component type listing of the MRS_COMPONENT_PATH directory, invalidated when the modification time of the directory changes
+_componentTypesCache = {"path": None, "mtime": None, "value": frozenset()}
+
+# Maps naming tokens to generated component descriptions, cleared when full (see MRS_Component.generateComponentDescription)
+_COMPONENT_DESCRIPTION_CACHE_SIZE = 512
+_componentDescriptionCache = {}
+
+# Maps a component description to its formatted component name, cleared when full (see MRS_Component._formatComponentName)
+_COMPONENT_NAME_CACHE_SIZE = 512
+_componentNameCache = {}
+
+# Maps a category name and classification to the base name of its member registration array, cleared when full (see MRS_Component._getRegistrationArrayName)
+_REGISTRATION_ARRAY_NAME_CACHE_SIZE = 64
+_registrationArrayNameCache = {}
+
+# Directory layout of a component type (see _getComponentTypePaths)
+ComponentTypePaths = namedtuple("ComponentTypePaths", ["componentType", "wip", "wipScripts", "wipData", "asset", "assetScripts", "assetData"])
+
+# Maps a (MRS_COMPONENT_PATH, componentType) pair to its ComponentTypePaths
+_componentTypePathsCache = {}
+
+# Collapses repeated characters within a generated component description (eg. the separator of an empty userSubType)
+_REPEATED_CHARACTER_RE = re.compile(r'(.)\1+')
+
+# Splits the base name of a member registration array into its category and classification tokens (see MRS_Component.deregisterMembersFromAll)
+_REGISTRATION_ARRAY_RE = re.compile(r'^(?P<category>[^_]+)_(?P<classification>[^_]*)$')
+
+# Maps the MObjectHandle hash code of a member to a tuple of MObjectHandles for the member and its dagContainer (see getComponentMObjectFromMember)
+_componentFromMemberCache = {}
+
+# The message attribute is inherited by every dependency node type, its MObject is retrieved once and shared (see _getMessagePlug)
+_messageAttributeCache = {"value": None}
+
+
+def _isMessagePlug(mPlug):
+    """Returns True if the given plug is a message type attribute (message connections are excluded from data dependency validation)"""
+    return mPlug.attribute().apiType() == om2.MFn.kMessageAttribute
+
+
+def _getMessagePlug(mObj_node):
+    """Returns the message plug for a dependency node without a name lookup against its attributes"""
+    mObj_messageAttr = _messageAttributeCache["value"]
+    if mObj_messageAttr is None:
+        mObj_messageAttr = _messageAttributeCache["value"] = om2.MFnDependencyNode(mObj_node).attribute("message")
+
+    return om2.MPlug(mObj_node, mObj_messageAttr)
+
+
+def _memoize(cache, cacheSize, key, func, *args, **kwargs):
+    """Returns the value cached against key, otherwise caches and returns the result of calling func with the given arguments
+    The cache is cleared once it holds cacheSize entries, bounding its size without tracking access order (functools.lru_cache is unavailable in Python 2)
+    """
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    value = func(*args, **kwargs)
+    if len(cache) >= cacheSize:
+        cache.clear()
+    cache[key] = value
+
+    return value
+
+
+def _iterUniqueMObjects(mObjs):
+    """Yields the given MObjects in order with duplicates removed, duplicates are identified by their MObjectHandle hash code"""
+    hashCodes_visited = set()
+    for mObj in mObjs:
+        hashCode = om2.MObjectHandle(mObj).hashCode()
+        if hashCode not in hashCodes_visited:
+            hashCodes_visited.add(hashCode)
+            yield mObj
+
+
+def _uniqueMObjects(mObjs):
+    """Returns the given MObjects in order with duplicates removed (see _iterUniqueMObjects)"""
+    return list(_iterUniqueMObjects(mObjs))
+
+
+def _iterDescendantShortNames(mObj_root):
+    """Yields the short name of each descendant of a transform, read through a single reused function set instead of resolving a partial path per descendant"""
+    mFnDependencyNode = om2.MFnDependencyNode()
+    for mObj_descendant in DAG.iterDescendants(mObj_root):
+        mFnDependencyNode.setObject(mObj_descendant)
+        yield mFnDependencyNode.name().rpartition(":")[2]
+
+
+def _coerceMember(member):
+    """
+    Returns the MObject for a single member input
+
+    :param <member>             [MObject, mNode] Member input
+    """
+    return member if isinstance(member, om2.MObject) else member.mObj_node
+
+
+def _iterCoercedMembers(members=None, selected=False):
+    """
+    Yields unique MObjects for the given member inputs, followed by any currently selected dependency nodes
+    Each node is yielded once, in order of its first occurrence (see _iterUniqueMObjects)
+    Inputs are coerced lazily, for consumers which only iterate the members once
+
+    :param <members>            [MObject, mNode, <iterable>(MObject, mNode)] Member inputs
+    :param <selected>           [bool] If True, selected dependency nodes are yielded after the member inputs
+    """
+    if members is None:
+        mObjs_members = ()
+    elif isinstance(members, (om2.MObject, BASE.Meta)):
+        mObjs_members = (_coerceMember(members),)
+    else:
+        mObjs_members = itertools.imap(_coerceMember, members)
+
+    if selected:
+        mObjs_members = itertools.chain(mObjs_members, DG.iterSelectedNodes())
+
+    return _iterUniqueMObjects(mObjs_members)
+
+
+def _coerceMembers(members=None, selected=False):
+    """
+    Returns a list of unique MObjects for the given member inputs, followed by any currently selected dependency nodes (see _iterCoercedMembers)
+
+    :param <members>            [MObject, mNode, <iterable>(MObject, mNode)] Member inputs
+    :param <selected>           [bool] If True, selected dependency nodes are appended to the result
+    """
+    return list(_iterCoercedMembers(members, selected))
 
 
 # ----------------------------------------------------------------------------
@@ -42,6 +185,23 @@ def iterComponents(asMeta=True):
     return BASE.iterMetaNodes(mTypeBases=META_TYPE.MRS_Component, asMeta=asMeta)
 
 
+def listComponents(asMeta=False):
+    """
+    Returns all mNodes that inherit from MRS_Component as a list, for consumers which require a count or iterate the result more than once
+
+    :param <asMeta>             [bool] If True, return each retrieved mNode as an instantiated mClass object
+
+    :return                     [list(MObject)] The retrieved mNodes as MObjects if asMeta is False
+                                [list(mNode)] The retrieved mNodes as instantiated mClass objects if asMeta is True
+    """
+    mObjs_components = list(BASE.iterMetaNodes(mTypeBases=_COMPONENT_MTYPE_BASES, asMeta=False))
+
+    if asMeta:
+        return [BASE.getMNode(mObj_component) for mObj_component in mObjs_components]
+
+    return mObjs_components
+
+
 def iterConnectedComponents(nodes=None, selected=False, asMeta=True):
     """
     Generator for conveniently iterating over all mNodes that inherit from MRS_Component and are directly connected to any of the given inputs or currently selected nodes
@@ -56,6 +216,44 @@ def iterConnectedComponents(nodes=None, selected=False, asMeta=True):
     return BASE.iterConnectedMNodes(nodes, selected=selected, downstream=True, upstream=True, walk=False, mTypeBases=META_TYPE.MRS_Component, asMeta=asMeta)
 
 
+def getComponentMObjectFromMember(member):
+    """
+    Returns the dagContainer for a given member as a MObject, without instantiating or verifying a MRS_Component
+    This method assumes a member is only ever connected to a single dagContainer
+    Results are cached per member and reused whilst both the member and dagContainer remain valid
+    A RuntimeError will be raised if no connection to a dagContainer is found
+
+    :param <member>     [MObject, mNode] Search the given member for a connected dagContainer
+
+    :return             [MObject] The dagContainer connected to the member
+    """
+    mObj_member = _coerceMember(member)
+    mObjHandle_member = om2.MObjectHandle(mObj_member)
+    hashCode_member = mObjHandle_member.hashCode()
+
+    try:
+        mObjHandle_cachedMember, mObjHandle_cachedContainer = _componentFromMemberCache[hashCode_member]
+    except KeyError:
+        pass
+    else:
+        if mObjHandle_cachedMember.isValid() and mObjHandle_cachedContainer.isValid() and mObjHandle_cachedMember == mObjHandle_member:
+            return mObjHandle_cachedContainer.object()
+
+        del _componentFromMemberCache[hashCode_member]
+
+    # Direct message destinations are filtered by type within the dependency graph iterator
+    mPlug_memberMessage = _getMessagePlug(mObj_member)
+
+    for mObj_hyperLayout in DG.iterDependenciesByNode(mPlug_memberMessage, directionType=om2.MItDependencyGraph.kDownstream, walk=False, filterTypes=(om2.MFn.kHyperLayout,)):
+        mPlug_hyperLayoutMessage = _getMessagePlug(mObj_hyperLayout)
+
+        for mObj_dagContainer in DG.iterDependenciesByNode(mPlug_hyperLayoutMessage, directionType=om2.MItDependencyGraph.kDownstream, walk=False, filterTypes=(om2.MFn.kDagContainer,)):
+            _componentFromMemberCache[hashCode_member] = (mObjHandle_member, om2.MObjectHandle(mObj_dagContainer))
+            return mObj_dagContainer
+
+    raise RuntimeError("{} : Node has no connection to a dagContainer".format(NAME.getNodeFullName(mObj_member)))
+
+
 def getComponentFromMember(member, asMeta=True):
     """
     Returns the dagContainer for a given member as a MObject or MRS_Component instance
@@ -67,29 +265,17 @@ def getComponentFromMember(member, asMeta=True):
 
     :return             [MObject, MRS_Component] The dagContainer as a MObject or instantiated MRS_Component object
     """
-    mObj_member = member if isinstance(member, om2.MObject) else member.mObj_node
-    mPlug_memberMessage = om2.MFnDependencyNode(mObj_member).findPlug("message", False)
-    mPlugArray_memberMessageDests = mPlug_memberMessage.destinationsWithConversions()
-
-    for mPlug_memberMessageDest in mPlugArray_memberMessageDests:
-        if mPlug_memberMessageDest.node().hasFn(om2.MFn.kHyperLayout):
-            mObj_hyperLayout = mPlug_memberMessageDest.node()
-            mPlug_hyperLayoutMessage = om2.MFnDependencyNode(mObj_hyperLayout).findPlug("message", False)
-            mPlugArray_hyperLayoutDests = mPlug_hyperLayoutMessage.destinationsWithConversions()
-
-            for mPlug_hyperLayoutDest in mPlugArray_hyperLayoutDests:
-                if mPlug_hyperLayoutDest.node().hasFn(om2.MFn.kDagContainer):
-                    mObj_dagContainer = mPlug_hyperLayoutDest.node()
-                    if asMeta:
-                        return MRS_Component(mObj_dagContainer)
-                    else:
-                        if BASE.isMNode(mObj_dagContainer, mTypes=BASE.META_TYPE.MRS_Component):
-                            return mObj_dagContainer
-                        else:
-                            raise RuntimeError("{} : Node has a connection to the following dagContainer however it is not tagged as a MRS_Component mNode : {}".format(
-                                NAME.getNodeFullName(mObj_member), NAME.getNodeFullName(mObj_dagContainer)))
+    mObj_dagContainer = getComponentMObjectFromMember(member)
 
-    raise RuntimeError("{} : Node has no connection to a dagContainer".format(NAME.getNodeFullName(mObj_member)))
+    if asMeta:
+        return MRS_Component(mObj_dagContainer)
+
+    if not BASE.isMNode(mObj_dagContainer, mTypes=BASE.META_TYPE.MRS_Component):
+        mObj_member = _coerceMember(member)
+        raise RuntimeError("{} : Node has a connection to the following dagContainer however it is not tagged as a MRS_Component mNode : {}".format(
+            NAME.getNodeFullName(mObj_member), NAME.getNodeFullName(mObj_dagContainer)))
+
+    return mObj_dagContainer
 
 
 def getComponentPath():
@@ -107,7 +293,90 @@ def getComponentPath():
 
 def getComponentTypes():
     """Returns a list of available component types"""
-    return list(PY_PATH.iterDirectories(getComponentPath(), walk=False, paths=False))
+    return list(_getComponentTypeSet())
+
+
+def _getComponentTypeSet():
+    """
+    Returns a frozenset of available component types
+    The directory listing is cached and only rescanned when the MRS_COMPONENT_PATH directory or its modification time changes
+    """
+    componentPath = getComponentPath()
+    mtime = os.stat(componentPath).st_mtime
+
+    if _componentTypesCache["path"] != componentPath or _componentTypesCache["mtime"] != mtime:
+        if _scandir is not None:
+            _componentTypesCache["value"] = frozenset(entry.name for entry in _scandir(componentPath) if entry.is_dir())
+        else:
+            _componentTypesCache["value"] = frozenset(
+                directoryName for directoryName in os.listdir(componentPath) if os.path.isdir(os.path.join(componentPath, directoryName)))
+        _componentTypesCache["path"] = componentPath
+        _componentTypesCache["mtime"] = mtime
+
+    return _componentTypesCache["value"]
+
+
+def _getComponentTypePaths(componentType):
+    """
+    Returns a ComponentTypePaths namedtuple holding the directory layout of the given component type
+    Layouts are cached against the current MRS_COMPONENT_PATH, therefore a change to the environment variable is always respected
+    """
+    componentPath = getComponentPath()
+    cacheKey = (componentPath, componentType)
+    try:
+        return _componentTypePathsCache[cacheKey]
+    except KeyError:
+        pass
+
+    componentTypePath = os.path.join(componentPath, componentType)
+    wipPath = os.path.join(componentTypePath, "wip")
+    assetPath = os.path.join(componentTypePath, "asset")
+    componentTypePaths = _componentTypePathsCache[cacheKey] = ComponentTypePaths(
+        componentTypePath, wipPath, os.path.join(wipPath, "scripts"), os.path.join(wipPath, "data"),
+        assetPath, os.path.join(assetPath, "scripts"), os.path.join(assetPath, "data"))
+
+    return componentTypePaths
+
+
+def _listSubdirectories(path):
+    """Returns a frozenset of the subdirectory names within the given directory path, or None if the directory cannot be read"""
+    try:
+        if _scandir is not None:
+            return frozenset(entry.name for entry in _scandir(path) if entry.is_dir())
+        return frozenset(directoryName for directoryName in os.listdir(path) if os.path.isdir(os.path.join(path, directoryName)))
+    except OSError:
+        return None
+
+
+def _scanDirectoryStructure(componentTypePath):
+    """
+    Returns a dict mapping the wip and asset directory names to a frozenset of their subdirectory names (None if the directory does not exist)
+    Returns None if the component type directory does not exist
+    Each directory is read once rather than checking every expected path individually
+    """
+    subdirectories = _listSubdirectories(componentTypePath)
+    if subdirectories is None:
+        return None
+
+    return {directoryName: _listSubdirectories(os.path.join(componentTypePath, directoryName)) if directoryName in subdirectories else None
+            for directoryName in ("wip", "asset")}
+
+
+def _listMatchingFiles(path, fileNameRe, paths=True):
+    """
+    Returns the names or paths of files within the given directory path whose names match the given compiled regex
+    Raises an OSError if the directory cannot be read
+    """
+    if _scandir is not None:
+        return [entry.path if paths else entry.name for entry in _scandir(path) if entry.is_file() and fileNameRe.match(entry.name)]
+
+    return [os.path.join(path, fileName) if paths else fileName for fileName in os.listdir(path)
+            if fileNameRe.match(fileName) and os.path.isfile(os.path.join(path, fileName))]
+
+
+def _invalidateComponentTypes():
+    """Forces the next component type query to rescan the MRS_COMPONENT_PATH directory"""
+    _componentTypesCache["mtime"] = None
 
 
 # ----------------------------------------------------------------------------
@@ -179,7 +448,7 @@ class MRS_Component(BASE.MetaDag):
     ASSET_FILE_NAMING_CONVENTION = "{componentType}_asset_{majorVersion}.ma"
     ASSET_PATH_NAMING_CONVENTION = "{MRS_COMPONENT_PATH}\\{componentType}\\asset\\{fileName}"
 
-    class Category(Enum):
+    class Category(IntEnum):
         input = 0
         output = 1
         guide = 2
@@ -227,7 +496,7 @@ class MRS_Component(BASE.MetaDag):
             # Check a new componentType was given
             if not componentType:
                 raise ValueError("MRS_Component : A new componentType was not given")
-            elif componentType in getComponentTypes():
+            elif componentType in _getComponentTypeSet():
                 raise RuntimeError("MRS_Component : {} : componentType already exists, use MRS_Module or MRS_Rig to import".format(componentType))
 
             # This will raise a ValueError if any aspect of the name is invalid
@@ -333,7 +602,12 @@ class MRS_Component(BASE.MetaDag):
         mObj_node = nodeData.get("mObj_node")
         mPath = nodeData.get("mPath")
         exclusiveData = {
-            "_mFnContainer": om2.MFnContainerNode(mObj_node)
+            "_mFnContainer": None,  # Constructed on first use (see mFnContainer)
+            "_filePathCache": None,
+            "_attrCache": {},
+            "_fsSnapshotCache": None,
+            "_membersSnapshotCache": None,
+            "_categoryGroupCache": {}
         }
         exclusiveSuperData = super(MRS_Component, self)._buildExclusiveData(mObj_node=mObj_node)
         exclusiveSuperData.update(exclusiveData)
@@ -350,10 +624,84 @@ class MRS_Component(BASE.MetaDag):
         if not nodeData.get("new"):
             self.verifyInterface()
 
+    def _fastAttr(self, attrName):
+        """
+        Returns a plug for an attribute of the encapsulated dagContainer, bypassing the Meta attribute interface
+        Attribute MObjects are resolved by name once per instance and reused to construct the plug for subsequent reads
+
+        :param <attrName>       [str] Name of an existing attribute on the encapsulated dagContainer
+
+        :return                 [MPlug] The plug for the attribute
+        """
+        try:
+            mObj_attr = self._attrCache[attrName]
+        except KeyError:
+            mObj_attr = om2.MFnDependencyNode(self._mObj_node).attribute(attrName)
+            if mObj_attr.isNull():
+                raise AttributeError("MRS_Component : {} : Component does not have attribute : {}".format(self.partialPathName, attrName))
+            self._attrCache[attrName] = mObj_attr
+
+        return om2.MPlug(self._mObj_node, mObj_attr)
+
+    def _fsSnapshot(self):
+        """
+        Returns a dict describing the state of the file system for this component, consumed by the file system validation properties
+        The component type listing, directory structure and file are each checked once per snapshot
+        If called within a _fsLock context, the pinned snapshot is returned
+        """
+        if self._fsSnapshotCache is not None:
+            return self._fsSnapshotCache
+
+        componentType = self._fastAttr("componentType").asString()
+        try:
+            hasValidComponentType = componentType in _getComponentTypeSet()
+        except RuntimeError:
+            hasValidComponentType = False
+
+        # The directory structure and file cannot exist if the component type directory does not exist
+        return {
+            "hasValidComponentType": hasValidComponentType,
+            "hasValidDirectoryStructure": hasValidComponentType and MRS_Component.directoryStructureExists(componentType),
+            "fileExists": hasValidComponentType and os.path.exists(self.filePath)
+        }
+
+    @contextlib.contextmanager
+    def _fsLock(self):
+        """Context manager which pins a single file system snapshot for consistent and repeated use by the file system validation properties"""
+        isOuterContext = self._fsSnapshotCache is None
+        if isOuterContext:
+            self._fsSnapshotCache = self._fsSnapshot()
+
+        try:
+            yield
+        finally:
+            if isOuterContext:
+                self._fsSnapshotCache = None
+
+    @contextlib.contextmanager
+    def _membersLock(self):
+        """Context manager which pins the results of member queries (see _getMemberMObjects, _categorizeMembers) for repeated use by consecutive validation and inspection passes"""
+        isOuterContext = self._membersSnapshotCache is None
+        if isOuterContext:
+            self._membersSnapshotCache = {}
+
+        try:
+            yield
+        finally:
+            if isOuterContext:
+                self._membersSnapshotCache = None
+
+    def _boolAttr(self, attrName):
+        """Returns the value of a boolean attribute on the encapsulated dagContainer as a bool (see _fastAttr)"""
+        return self._fastAttr(attrName).asBool()
+
     # --- Public Properties ----------------------------------------------------------------------------
 
     @BASE.Meta_Property
     def mFnContainer(self):
+        if self._mFnContainer is None:
+            self._mFnContainer = om2.MFnContainerNode(self._mObj_node)
+
         return self._mFnContainer
 
     @property
@@ -418,9 +766,19 @@ class MRS_Component(BASE.MetaDag):
 
     @property
     def filePath(self):
-        pathConvention = MRS_Component.ASSET_PATH_NAMING_CONVENTION if self.isAsset else MRS_Component.WIP_PATH_NAMING_CONVENTION
-        filePath = pathConvention.format(MRS_COMPONENT_PATH=getComponentPath(), componentType=self.componentType, fileName=self.fileName)
-        return os.path.abspath(filePath)
+        # The formatted path is cached against the data it is composed from
+        isAsset = self._boolAttr("isAsset")
+        componentType = self._fastAttr("componentType").asString()
+        fileName = self._fastAttr("fileName").asString()
+        cacheKey = (os.environ.get("MRS_COMPONENT_PATH"), isAsset, componentType, fileName)
+
+        if self._filePathCache is not None and self._filePathCache[0] == cacheKey:
+            return self._filePathCache[1]
+
+        pathConvention = MRS_Component.ASSET_PATH_NAMING_CONVENTION if isAsset else MRS_Component.WIP_PATH_NAMING_CONVENTION
+        filePath = os.path.abspath(pathConvention.format(MRS_COMPONENT_PATH=getComponentPath(), componentType=componentType, fileName=fileName))
+        self._filePathCache = (cacheKey, filePath)
+        return filePath
 
     @property
     def directoryPath(self):
@@ -432,7 +790,7 @@ class MRS_Component(BASE.MetaDag):
 
     @property
     def isAsset(self):
-        return self.getAttr("isAsset").get()
+        return self._boolAttr("isAsset")
 
     @property
     def isWip(self):
@@ -440,7 +798,7 @@ class MRS_Component(BASE.MetaDag):
 
     @property
     def isBlackBoxed(self):
-        return self.blackBox.get()
+        return self._boolAttr("blackBox")
 
     @isBlackBoxed.setter
     def isBlackBoxed(self, state):
@@ -448,7 +806,7 @@ class MRS_Component(BASE.MetaDag):
 
     @property
     def isGuided(self):
-        return self.getAttr("isGuided").get()
+        return self._boolAttr("isGuided")
 
     @isGuided.setter
     def isGuided(self, state):
@@ -466,14 +824,11 @@ class MRS_Component(BASE.MetaDag):
         Returns True if the encapsulated dagContainer has a componentType attribute which references a valid component
         A valid componentType must reference an existing component in the MRS_COMPONENT_PATH directory (environment variable)
         """
-        try:
-            return self.getAttr("componentType").get() in getComponentTypes()
-        except RuntimeError:
-            return False
+        return self._fsSnapshot()["hasValidComponentType"]
 
     @property
     def hasValidDirectoryStructure(self):
-        return MRS_Component.directoryStructureExists(self.componentType)
+        return self._fsSnapshot()["hasValidDirectoryStructure"]
 
     @property
     def hasValidFileName(self):
@@ -481,7 +836,7 @@ class MRS_Component(BASE.MetaDag):
         Checks if the filename stored on this component references a valid file in the standard directory structure of this component type
         Checks if the filename of this component conforms to the standard component naming conventions
         """
-        if not os.path.exists(self.filePath):
+        if not self._fsSnapshot()["fileExists"]:
             return False
 
         requiredFileName = self.createFileName(modification="")[:-1]
@@ -490,8 +845,14 @@ class MRS_Component(BASE.MetaDag):
     @property
     def hasValidName(self):
         """Returns True if the encapsulated dagContainer has a valid name (ie. conforms to the COMPONENT_NAMING_CONVENTION)"""
+        userType = self._fastAttr("userType").asString()
+        locality = self._fastAttr("locality").asString()
+        userSubType = self._fastAttr("userSubType").asString() or None
+        index = self._fastAttr("index").asInt() or None
+
+        # Generated names are cached, therefore repeated checks only pay for the attribute reads
         try:
-            requiredName = MRS_Component.generateComponentName(userType=self.userType, locality=self.locality, userSubType=self.userSubType, index=self.index)
+            requiredName = MRS_Component.generateComponentName(userType=userType, locality=locality, userSubType=userSubType, index=index)
         except ValueError:
             return False
 
@@ -506,62 +867,55 @@ class MRS_Component(BASE.MetaDag):
         except ValueError:
             return False
 
-        mNodes_members = self.getMembers(asMeta=True)
-        for mNode_member in mNodes_members:
-            if self.hasChild(mNode_member):
-                try:
-                    MRS_Component.Category[mNode_member.shortName]
-                except KeyError:
-                    return False
-            else:
-                if not mNode_member.shortName.startswith(componentDescription):
+        # Retrieve the children once instead of querying the hierarchy per member
+        hashCodes_children = {om2.MObjectHandle(mObj_child).hashCode() for mObj_child in self.iterChildren()}
+
+        for mObj_member in self._getMemberMObjects():
+            memberShortName = NAME.getNodeShortName(mObj_member)
+            if om2.MObjectHandle(mObj_member).hashCode() in hashCodes_children:
+                if memberShortName not in _CATEGORY_NAMES:
                     return False
+            elif not memberShortName.startswith(componentDescription):
+                return False
 
         return True
 
     @property
     def hasValidEncapsulation(self):
-        mNodes_members = self.getMembers(asMeta=True)
-        mNodes_members.append(self)
-        mObjs_members = [mNode_member.mObj_node for mNode_member in mNodes_members]
-        mObjs_inputMembers = self.getDagMembers(MRS_Component.Category.input)
-        mObjs_outputMembers = self.getDagMembers(MRS_Component.Category.output)
-
-        for mNode_member in mNodes_members:
-            mObjs_inputs_generator = mNode_member.iterInputNodes(excludeMessage=True)
-            mObjs_outputs_generator = mNode_member.iterOutputNodes(excludeMessage=True)
-
-            for mObj_input in mObjs_inputs_generator:
-                if mObj_input not in mObjs_members:
-                    if mNode_member.mObj_node not in mObjs_inputMembers:
-                        return False
-
-            for mObj_output in mObjs_outputs_generator:
-                if mObj_output not in mObjs_members:
-                    if mNode_member.mObj_node not in mObjs_outputMembers:
-                        return False
+        mObjs_members = list(self._getMemberMObjects())
+        mObjs_members.append(self.mObj_node)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
+        # Membership is tested against MObjectHandle hash codes to avoid linear MObject equality scans per connection
+        hashCodes_inputMembers = {om2.MObjectHandle(mObj_inputMember).hashCode() for mObj_inputMember in mObjs_dagMembersByCategory[MRS_Component.Category.input]}
+        hashCodes_outputMembers = {om2.MObjectHandle(mObj_outputMember).hashCode() for mObj_outputMember in mObjs_dagMembersByCategory[MRS_Component.Category.output]}
+
+        # Only edges which cross the component boundary are collected, connections between members are never visited
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_members, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=mObjs_members):
+            if not _isMessagePlug(mPlug_source) and om2.MObjectHandle(mPlug_dest.node()).hashCode() not in hashCodes_inputMembers:
+                return False
+
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_members, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=mObjs_members):
+            if not _isMessagePlug(mPlug_source) and om2.MObjectHandle(mPlug_source.node()).hashCode() not in hashCodes_outputMembers:
+                return False
 
         return True
 
     @property
     def hasValidGuide(self):
         # Method relies upon the unenforced guide naming rule
-        mNodes_guideMembers = self.getNamedMembers(MRS_Component.Category.guide, asMeta=True)
-        mObjs_guideMembers = [mNode_guideMember.mObj_node for mNode_guideMember in mNodes_guideMembers]
-        mObjs_inputMembers = self.getDagMembers(MRS_Component.Category.input)
-        mObjs_guidedMembers = self.getDagMembers(MRS_Component.Category.guided)
+        mObjs_guideMembers = self.getNamedMembers(MRS_Component.Category.guide)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
+        mObjs_inputMembers = mObjs_dagMembersByCategory[MRS_Component.Category.input]
+        mObjs_guidedMembers = mObjs_dagMembersByCategory[MRS_Component.Category.guided]
 
-        for mNode_guideMember in mNodes_guideMembers:
-            mObjs_inputs_generator = mNode_guideMember.iterInputNodes(excludeMessage=True)
-            mObjs_outputs_generator = mNode_guideMember.iterOutputNodes(excludeMessage=True)
+        # Only edges to nodes outside of the permitted groups are collected
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=itertools.chain(mObjs_guideMembers, mObjs_inputMembers)):
+            if not _isMessagePlug(mPlug_source):
+                return False
 
-            for mObj_input in mObjs_inputs_generator:
-                if mObj_input not in mObjs_guideMembers and mObj_input not in mObjs_inputMembers:
-                    return False
-
-            for mObj_output in mObjs_outputs_generator:
-                if mObj_output not in mObjs_guideMembers and mObj_output not in mObjs_guidedMembers:
-                    return False
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=itertools.chain(mObjs_guideMembers, mObjs_guidedMembers)):
+            if not _isMessagePlug(mPlug_source):
+                return False
 
         return True
 
@@ -582,157 +936,141 @@ class MRS_Component(BASE.MetaDag):
         updated = super(MRS_Component, self).validate(mNodeID)
 
         if updated:
-            self._mFnContainer = om2.MFnContainerNode(self._mObj_node)
+            self._mFnContainer = None
+            self._attrCache = {}
+            self._categoryGroupCache = {}
 
         return updated
 
     def verifyInterface(self):
-        if not self.hasValidComponentType:
-            raise RuntimeError("MRS_Component : {} : Component has an invalid componentType".format(self.partialPathName))
-        if not self.hasValidEncapsulation:
-            self.inspectEncapsulation()
-            raise RuntimeError("MRS_Component : {} : Component is not encapsulated, see log info".format(self.partialPathName))
-        if not self.hasValidGuide:
-            self.inspectGuide()
-            raise RuntimeError("MRS_Component : {} : Component does not have a valid guide, see log info".format(self.partialPathName))
-        if not self.hasValidDirectoryStructure:
-            self.inspectDirectoryStructure(self.componentType)
-            raise RuntimeError("MRS_Component : {} : Component has an invalid directory structure, see log info".format(self.partialPathName))
-        if not self.hasValidFileName:
-            self.inspectFileName()
-            raise RuntimeError("MRS_Component : {} : Component has an invalid filename, see log info".format(self.partialPathName))
-        if not self.hasValidName or not self.hasValidMemberNames:
-            self.inspectNaming()
-            raise RuntimeError("MRS_Component : {} : Component or component member/s have an invalid name, see log info".format(self.partialPathName))
+        """
+        Verifies the encapsulated dagContainer is compatible with the MRS_Component interface
+        A RuntimeError will be raised for the first incompatibility that is found
+        """
+        # Member queries are shared by the validation properties and any inspection of a failure
+        # Checks are ordered by cost, the file system and naming checks fail fast before the member dependency graph is inspected
+        with self._fsLock(), self._membersLock():
+            if not self.hasValidComponentType:
+                raise RuntimeError("MRS_Component : {} : Component has an invalid componentType".format(self.partialPathName))
+            if not self.hasValidDirectoryStructure:
+                self.inspectDirectoryStructure(self.componentType)
+                raise RuntimeError("MRS_Component : {} : Component has an invalid directory structure, see log info".format(self.partialPathName))
+            if not self.hasValidFileName:
+                self.inspectFileName()
+                raise RuntimeError("MRS_Component : {} : Component has an invalid filename, see log info".format(self.partialPathName))
+            if not self.hasValidName or not self.hasValidMemberNames:
+                self.inspectNaming()
+                raise RuntimeError("MRS_Component : {} : Component or component member/s have an invalid name, see log info".format(self.partialPathName))
+            if not self.hasValidGuide:
+                self.inspectGuide()
+                raise RuntimeError("MRS_Component : {} : Component does not have a valid guide, see log info".format(self.partialPathName))
+            if not self.hasValidEncapsulation:
+                self.inspectEncapsulation()
+                raise RuntimeError("MRS_Component : {} : Component is not encapsulated, see log info".format(self.partialPathName))
 
     # --- Directory Access ----------------------------------------------------------------------------
 
     @staticmethod
     def directoryStructureExists(componentType):
-        componentPath = getComponentPath()
-        componentTypePath = os.path.join(componentPath, componentType)
-        wipDirectorPath = os.path.join(componentTypePath, "wip")
-        wipScriptsDirectorPath = os.path.join(wipDirectorPath, "scripts")
-        wipDataDirectorPath = os.path.join(wipDirectorPath, "data")
-        assetDirectorPath = os.path.join(componentTypePath, "asset")
-        assetScriptsDirectorPath = os.path.join(assetDirectorPath, "scripts")
-        assetDataDirectorPath = os.path.join(assetDirectorPath, "data")
-        return (os.path.exists(componentTypePath)
-                and os.path.exists(wipDirectorPath) and os.path.exists(wipScriptsDirectorPath) and os.path.exists(wipDataDirectorPath)
-                and os.path.exists(assetDirectorPath) and os.path.exists(assetScriptsDirectorPath) and os.path.exists(assetDataDirectorPath))
+        directoryStructure = _scanDirectoryStructure(_getComponentTypePaths(componentType).componentType)
+        if directoryStructure is None:
+            return False
+
+        return all(subdirectories is not None and "scripts" in subdirectories and "data" in subdirectories
+                   for subdirectories in directoryStructure.values())
 
     @staticmethod
     def inspectDirectoryStructure(componentType):
-        componentPath = getComponentPath()
-        componentTypePath = os.path.join(componentPath, componentType)
-        wipDirectorPath = os.path.join(componentTypePath, "wip")
-        wipScriptsDirectorPath = os.path.join(wipDirectorPath, "scripts")
-        wipDataDirectorPath = os.path.join(wipDirectorPath, "data")
-        assetDirectorPath = os.path.join(componentTypePath, "asset")
-        assetScriptsDirectorPath = os.path.join(assetDirectorPath, "scripts")
-        assetDataDirectorPath = os.path.join(assetDirectorPath, "data")
+        if not log.isEnabledFor(logging.INFO):
+            return
+
+        componentTypePath, wipDirectorPath, wipScriptsDirectorPath, wipDataDirectorPath, \
+            assetDirectorPath, assetScriptsDirectorPath, assetDataDirectorPath = _getComponentTypePaths(componentType)
+
+        directoryStructure = _scanDirectoryStructure(componentTypePath)
+        componentTypeDirectoryExists = directoryStructure is not None
+        if not componentTypeDirectoryExists:
+            directoryStructure = {"wip": None, "asset": None}
+        wipSubdirectories = directoryStructure["wip"] or frozenset()
+        assetSubdirectories = directoryStructure["asset"] or frozenset()
 
         predMsg = {False: "does not exist", True: "exists"}
-        log.info("MRS_Component : {} : Component directory {}".format(componentTypePath, predMsg[os.path.exists(componentTypePath)]))
-        log.info("MRS_Component : {} : Component wip directory {}".format(wipDirectorPath, predMsg[os.path.exists(wipDirectorPath)]))
-        log.info("MRS_Component : {} : Component wip scripts directory {}".format(wipScriptsDirectorPath, predMsg[os.path.exists(wipScriptsDirectorPath)]))
-        log.info("MRS_Component : {} : Component wip data directory {}".format(wipDataDirectorPath, predMsg[os.path.exists(wipDataDirectorPath)]))
-        log.info("MRS_Component : {} : Component asset directory {}".format(assetDirectorPath, predMsg[os.path.exists(assetDirectorPath)]))
-        log.info("MRS_Component : {} : Component asset scripts directory {}".format(assetScriptsDirectorPath, predMsg[os.path.exists(assetScriptsDirectorPath)]))
-        log.info("MRS_Component : {} : Component asset data directory {}".format(assetDataDirectorPath, predMsg[os.path.exists(assetDataDirectorPath)]))
+        log.info("MRS_Component : {} : Component directory {}".format(componentTypePath, predMsg[componentTypeDirectoryExists]))
+        log.info("MRS_Component : {} : Component wip directory {}".format(wipDirectorPath, predMsg[directoryStructure["wip"] is not None]))
+        log.info("MRS_Component : {} : Component wip scripts directory {}".format(wipScriptsDirectorPath, predMsg["scripts" in wipSubdirectories]))
+        log.info("MRS_Component : {} : Component wip data directory {}".format(wipDataDirectorPath, predMsg["data" in wipSubdirectories]))
+        log.info("MRS_Component : {} : Component asset directory {}".format(assetDirectorPath, predMsg[directoryStructure["asset"] is not None]))
+        log.info("MRS_Component : {} : Component asset scripts directory {}".format(assetScriptsDirectorPath, predMsg["scripts" in assetSubdirectories]))
+        log.info("MRS_Component : {} : Component asset data directory {}".format(assetDataDirectorPath, predMsg["data" in assetSubdirectories]))
 
     @staticmethod
     def createDirectoryStructure(componentType):
-        componentPath = getComponentPath()
-        componentTypePath = os.path.join(componentPath, componentType)
-        wipDirectorPath = os.path.join(componentTypePath, "wip")
-        wipScriptsDirectorPath = os.path.join(wipDirectorPath, "scripts")
-        wipDataDirectorPath = os.path.join(wipDirectorPath, "data")
-        assetDirectorPath = os.path.join(componentTypePath, "asset")
-        assetScriptsDirectorPath = os.path.join(assetDirectorPath, "scripts")
-        assetDataDirectorPath = os.path.join(assetDirectorPath, "data")
+        componentTypePath, wipDirectorPath, wipScriptsDirectorPath, wipDataDirectorPath, \
+            assetDirectorPath, assetScriptsDirectorPath, assetDataDirectorPath = _getComponentTypePaths(componentType)
 
         if os.path.exists(componentTypePath):
             raise RuntimeError("MRS_Component : {} : Component directory already exist".format(componentTypePath))
         else:
-            os.mkdir(componentTypePath)
-            os.mkdir(wipDirectorPath)
-            os.mkdir(wipScriptsDirectorPath)
-            os.mkdir(wipDataDirectorPath)
-            os.mkdir(assetDirectorPath)
-            os.mkdir(assetScriptsDirectorPath)
-            os.mkdir(assetDataDirectorPath)
+            # Intermediate directories are created by each leaf, a partially created structure is removed on failure
+            try:
+                os.makedirs(wipScriptsDirectorPath)
+                os.makedirs(wipDataDirectorPath)
+                os.makedirs(assetScriptsDirectorPath)
+                os.makedirs(assetDataDirectorPath)
+            except OSError:
+                shutil.rmtree(componentTypePath, ignore_errors=True)
+                raise
+
+        _invalidateComponentTypes()
 
     @staticmethod
     def getWipFiles(componentType, paths=True):
-        componentPath = getComponentPath()
-        componentTypePath = os.path.join(componentPath, componentType)
-        wipDirectorPath = os.path.join(componentTypePath, "wip")
+        wipDirectorPath = _getComponentTypePaths(componentType).wip
 
-        if not os.path.exists(wipDirectorPath):
-            raise RuntimeError("MRS_Component : {} : Component wip directory does not exist".format(wipDirectorPath))
-
-        filteredFiles = []
-        for file in PY_PATH.iterFiles(wipDirectorPath, paths=paths):
-            fileName = os.path.basename(file)
-            nameTokens = fileName.split("_")
-            try:
-                assert len(nameTokens) >= 5
-                assert nameTokens[0] == componentType
-                assert nameTokens[1] == "wip"
-                assert nameTokens[2].isdigit()
-                assert nameTokens[3].isdigit()
-            except AssertionError:
-                pass
-            else:
-                filteredFiles.append(file)
+        # Names must be composed of at least five underscore separated tokens : {componentType}_wip_{majorVersion}_{minorVersion}_{modification}
+        wipFileNameRe = re.compile(r"^" + re.escape(componentType) + r"_wip_\d+_\d+_")
 
-        return filteredFiles
+        try:
+            return _listMatchingFiles(wipDirectorPath, wipFileNameRe, paths=paths)
+        except OSError:
+            raise RuntimeError("MRS_Component : {} : Component wip directory does not exist".format(wipDirectorPath))
 
     @staticmethod
     def getAssetFiles(componentType, paths=True):
-        componentPath = getComponentPath()
-        componentTypePath = os.path.join(componentPath, componentType)
-        assetDirectorPath = os.path.join(componentTypePath, "asset")
+        assetDirectorPath = _getComponentTypePaths(componentType).asset
 
-        if not os.path.exists(assetDirectorPath):
-            raise RuntimeError("MRS_Component : {} : Component asset directory does not exist".format(assetDirectorPath))
+        # Names must be composed of three underscore separated tokens, followed by an optional extension : {componentType}_asset_{majorVersion}
+        assetFileNameRe = re.compile(r"^" + re.escape(componentType) + r"_asset_\d+(?:\.[^._]*)?$")
 
-        filteredFiles = []
-        for file in PY_PATH.iterFiles(assetDirectorPath, paths=paths):
-            fileName = os.path.basename(file)
-            nameTokens = fileName.split("_")
-            try:
-                assert len(nameTokens) == 3
-                assert nameTokens[0] == componentType
-                assert nameTokens[1] == "asset"
-                assert nameTokens[2].isdigit()
-            except AssertionError:
-                pass
-            else:
-                filteredFiles.append(file)
-
-        return filteredFiles
+        try:
+            return _listMatchingFiles(assetDirectorPath, assetFileNameRe, paths=paths)
+        except OSError:
+            raise RuntimeError("MRS_Component : {} : Component asset directory does not exist".format(assetDirectorPath))
 
     # --- Introspect ----------------------------------------------------------------------------
 
+    # Inspection methods only produce log info, each returns immediately if info records would not be emitted
+
     def inspectEdges(self):
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         hasInputConnections = False
         hasOutputConnections = False
-        mNodes_inputMembers = self.getDagMembers(MRS_Component.Category.input, asMeta=True)
-        mNodes_outputMembers = self.getDagMembers(MRS_Component.Category.output, asMeta=True)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
 
-        for mNode_inputMember in mNodes_inputMembers:
-            for mAttr_source, mAttr_dest in mNode_inputMember.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kUpstream, walk=False, pruneMessage=True, asMeta=True):
+        # Edges are retrieved as plugs, names are only resolved for logging
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_dagMembersByCategory[MRS_Component.Category.input], directionType=om2.MItDependencyGraph.kUpstream):
+            if not _isMessagePlug(mPlug_source):
                 hasInputConnections = True
                 log.info("MRS_Component : {} : Component has the following input connection : {} -> {}".format(
-                    self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
 
-        for mNode_outputMember in mNodes_outputMembers:
-            for mAttr_source, mAttr_dest in mNode_outputMember.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kDownstream, walk=False, pruneMessage=True, asMeta=True):
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_dagMembersByCategory[MRS_Component.Category.output], directionType=om2.MItDependencyGraph.kDownstream):
+            if not _isMessagePlug(mPlug_source):
                 hasOutputConnections = True
                 log.info("MRS_Component : {} : Component has the following output connection : {} -> {}".format(
-                    self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
 
         if not hasInputConnections:
             log.info("MRS_Component : {} : Component has no input connections".format(self.partialPathName))
@@ -740,74 +1078,81 @@ class MRS_Component(BASE.MetaDag):
             log.info("MRS_Component : {} : Component has no output connections".format(self.partialPathName))
 
     def inspectEncapsulation(self):
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         hasValidEncapsulation = True
-        mNodes_members = self.getMembers(asMeta=True)
-        mNodes_members.append(self)
-        mObjs_members = [mNode_member.mObj_node for mNode_member in mNodes_members]
-        mObjs_inputMembers = self.getDagMembers(MRS_Component.Category.input)
-        mObjs_outputMembers = self.getDagMembers(MRS_Component.Category.output)
-
-        for mNode_member in mNodes_members:
-            # Iterate through each direct upstream connection to the member to find which ones break encapsulation
-            for mAttr_source, mAttr_dest in mNode_member.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kUpstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_source.mObj_node not in mObjs_members and mAttr_dest.mObj_node not in mObjs_inputMembers:
-                    hasValidEncapsulation = False
-                    log.info("MRS_Component : {} : Component encapsulation is broken via the following incoming data dependency : {} -> {}".format(
-                        self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
-
-            # Iterate through each direct downstream connection from the member to find which ones break encapsulation
-            for mAttr_source, mAttr_dest in mNode_member.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kDownstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_dest.mObj_node not in mObjs_members and mAttr_source.mObj_node not in mObjs_outputMembers:
-                    hasValidEncapsulation = False
-                    log.info("MRS_Component : {} : Component encapsulation is broken via the following outgoing data dependency : {} -> {}".format(
-                        self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
+        mObjs_members = list(self._getMemberMObjects())
+        mObjs_members.append(self.mObj_node)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
+        # Hash code sets are constructed once for membership testing
+        hashCodes_inputMembers = frozenset(om2.MObjectHandle(mObj_inputMember).hashCode() for mObj_inputMember in mObjs_dagMembersByCategory[MRS_Component.Category.input])
+        hashCodes_outputMembers = frozenset(om2.MObjectHandle(mObj_outputMember).hashCode() for mObj_outputMember in mObjs_dagMembersByCategory[MRS_Component.Category.output])
+
+        # Only edges which cross the component boundary are collected, connections between members are never visited
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_members, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=mObjs_members):
+            if not _isMessagePlug(mPlug_source) and om2.MObjectHandle(mPlug_dest.node()).hashCode() not in hashCodes_inputMembers:
+                hasValidEncapsulation = False
+                log.info("MRS_Component : {} : Component encapsulation is broken via the following incoming data dependency : {} -> {}".format(
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
+
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_members, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=mObjs_members):
+            if not _isMessagePlug(mPlug_source) and om2.MObjectHandle(mPlug_source.node()).hashCode() not in hashCodes_outputMembers:
+                hasValidEncapsulation = False
+                log.info("MRS_Component : {} : Component encapsulation is broken via the following outgoing data dependency : {} -> {}".format(
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
 
         if hasValidEncapsulation:
             log.info("MRS_Component : {} : Component has valid encapsulation".format(self.partialPathName))
 
     def inspectGuide(self):
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         if not self.hasGuide:
-            log.debug("MRS_Component : {} : Component does not have a guide")
+            log.debug("MRS_Component : %s : Component does not have a guide", self.partialPathName)
             return
 
         # Method relies upon the unenforced guide naming rule
         hasValidGuide = True
-        mNodes_guideMembers = self.getNamedMembers(MRS_Component.Category.guide, asMeta=True)
-        mObjs_guideMembers = [mNode_guideMember.mObj_node for mNode_guideMember in mNodes_guideMembers]
-        mObjs_inputMembers = self.getDagMembers(MRS_Component.Category.input)
-        mObjs_guidedMembers = self.getDagMembers(MRS_Component.Category.guided)
-
-        for mNode_guideMember in mNodes_guideMembers:
-            # Iterate through each direct upstream connection to the guide member to find which ones are invalid
-            for mAttr_source, mAttr_dest in mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kUpstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_source.mObj_node not in mObjs_guideMembers and mAttr_source.mObj_node not in mObjs_inputMembers:
-                    hasValidGuide = False
-                    log.info("MRS_Component : {} : Component guide node has invalid input connection : {} -> {}".format(
-                        self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
-
-            # Iterate through each direct downstream connection from the guide member to find which ones are invalid
-            for mAttr_source, mAttr_dest in mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kDownstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_dest.mObj_node not in mObjs_guideMembers and mAttr_dest.mObj_node not in mObjs_guidedMembers:
-                    hasValidGuide = False
-                    log.info("MRS_Component : {} : Component guide node has invalid output connection : {} -> {}".format(
-                        self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
+        mObjs_guideMembers = self.getNamedMembers(MRS_Component.Category.guide)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
+
+        # The permitted dependencies are excluded up front so that only invalid edges are collected
+        mObjs_permittedInputs = mObjs_guideMembers + mObjs_dagMembersByCategory[MRS_Component.Category.input]
+        mObjs_permittedOutputs = mObjs_guideMembers + mObjs_dagMembersByCategory[MRS_Component.Category.guided]
+
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=mObjs_permittedInputs):
+            if not _isMessagePlug(mPlug_source):
+                hasValidGuide = False
+                log.info("MRS_Component : {} : Component guide node has invalid input connection : {} -> {}".format(
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
+
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=mObjs_permittedOutputs):
+            if not _isMessagePlug(mPlug_source):
+                hasValidGuide = False
+                log.info("MRS_Component : {} : Component guide node has invalid output connection : {} -> {}".format(
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
 
         if hasValidGuide:
             log.info("MRS_Component : {} : Component has a valid guide".format(self.partialPathName))
 
     def inspectNaming(self):
+        if not log.isEnabledFor(logging.INFO):
+            return
+
+        # Name data is read once and shared by description generation and the log messages
+        userType, locality, userSubType, index = self.userType, self.locality, self.userSubType, self.index
+
         try:
-            requiredComponentDescription = self.generateComponentDescription(userType=self.userType, locality=self.locality, userSubType=self.userSubType, index=self.index)
+            requiredComponentDescription = self.generateComponentDescription(userType=userType, locality=locality, userSubType=userSubType, index=index)
         except ValueError:
             log.info("MRS_Component : {} : Component has invalid cached name data : userType = {userType}, locality = {locality}, userSubType = {userSubType}, index = {index}".format(
                 self.partialPathName, userType=userType, locality=locality, userSubType=userSubType, index=index))
             log.info("MRS_Component : {} : Futher inspection of component naming has failed due to invalid cached name data, exiting..".format(self.partialPathName))
             return
 
-        requiredComponentName = cls.COMPONENT_NAMING_CONVENTION.format(description=requiredComponentDescription)
-
-        mNodes_children = list(self.iterChildren())
-        mNodes_members = self.getMembers(asMeta=True)
+        requiredComponentName = self._formatComponentName(requiredComponentDescription)
 
         # Inspect component name
         if self.shortName == requiredComponentName:
@@ -818,26 +1163,33 @@ class MRS_Component(BASE.MetaDag):
                 self.partialPathName, userType=userType, locality=locality, userSubType=userSubType, index=index))
 
         # Inspect component member names
+        # The children are only required if a member does not conform to the naming convention, the set is built on first use
         hasValidMemberNames = True
-        for mNode_member in mNodes_members:
-            if not mNode_member.shortName.startswith(requiredComponentDescription):
-                if mNode_member in mNodes_children:
-                    try:
-                        MRS_Component.Category[mNode_member.shortName]
-                    except KeyError:
+        hashCodes_children = None
+        for mObj_member in self._getMemberMObjects():
+            memberShortName = NAME.getNodeShortName(mObj_member)
+            if not memberShortName.startswith(requiredComponentDescription):
+                if hashCodes_children is None:
+                    hashCodes_children = {om2.MObjectHandle(mObj_child).hashCode() for mObj_child in self.iterChildren()}
+
+                if om2.MObjectHandle(mObj_member).hashCode() in hashCodes_children:
+                    if memberShortName not in _CATEGORY_BY_NAME:
                         hasValidMemberNames = False
                         log.info("MRS_Component : {} : Component contains hierarchy group with invalid name : {}".format(
-                            self.partialPathName, mNode_member.partialPathName))
+                            self.partialPathName, NAME.getNodePartialName(mObj_member)))
                 else:
                     hasValidMemberNames = False
                     log.info("MRS_Component : {} : Component contains member with invalid name : {}".format(
-                        self.partialPathName, mNode_member.partialPathName))
+                        self.partialPathName, NAME.getNodePartialName(mObj_member)))
 
         if hasValidMemberNames:
             log.info("MRS_Component : {} : All component members have valid names".format(self.partialPathName))
 
     def inspectFileName(self):
-        if os.path.exists(self.filePath):
+        if not log.isEnabledFor(logging.INFO):
+            return
+
+        if os.path.lexists(self.filePath):
             log.info("MRS_Component : {} : Component fileName references an existing file : {}".format(self.partialPathName, self.filePath))
         else:
             log.info("MRS_Component : {} : Component fileName does not reference an existing file : {}".format(self.partialPathName, self.filePath))
@@ -858,11 +1210,74 @@ class MRS_Component(BASE.MetaDag):
                 log.info("MRS_Component : {} : Component fileName \"{fileName}\" is not composed from cached data : componentType = {componentType}, majorVersion = {majorVersion}".format(
                     self.partialPathName, fileName=self.fileName, componentType=self.componentType, majorVersion=self.majorVersion))
 
+    def _getMemberMObjects(self):
+        """
+        Returns the members of the encapsulated dagContainer as an MObjectArray retrieved directly from the cached MFnContainerNode
+        Used by validation methods in place of getMembers(asMeta=True) to avoid instantiating an mNode per member
+        If called within a _membersLock context, the array is retrieved once and shared
+        """
+        membersSnapshot = self._membersSnapshotCache
+        if membersSnapshot is not None and "members" in membersSnapshot:
+            return membersSnapshot["members"]
+
+        mObjArray_members = self.mFnContainer.getMembers()
+        if membersSnapshot is not None:
+            membersSnapshot["members"] = mObjArray_members
+
+        return mObjArray_members
+
+    def _categorizeMembers(self):
+        """
+        Returns a dict mapping each Category to a list of its DAG members (ie. descendants of the category hierarchy group)
+        All category hierarchy groups are partitioned in a single sweep of the component hierarchy, providing an alternative to calling getDagMembers per category
+        If called within a _membersLock context, the sweep is performed once and shared
+        """
+        membersSnapshot = self._membersSnapshotCache
+        if membersSnapshot is not None and "dagMembersByCategory" in membersSnapshot:
+            return membersSnapshot["dagMembersByCategory"]
+
+        mObjs_dagMembersByCategory = {category: [] for category in MRS_Component.Category}
+
+        for mObj_child in self.iterChildren():
+            childShortName = NAME.getNodeShortName(mObj_child)
+            if childShortName in _CATEGORY_NAMES:
+                category = _CATEGORY_BY_NAME[childShortName]
+                self._categoryGroupCache[category] = om2.MObjectHandle(mObj_child)
+                mObjs_dagMembersByCategory[category].extend(DAG.iterDescendants(mObj_child))
+
+        if membersSnapshot is not None:
+            membersSnapshot["dagMembersByCategory"] = mObjs_dagMembersByCategory
+
+        return mObjs_dagMembersByCategory
+
+    def _getCategoryGroupMObject(self, category):
+        """
+        Returns the category hierarchy group as an MObject
+        The group is resolved by name once and reused until it is deleted, renamed or reparented
+        Raises a RuntimeError if the component does not have the category hierarchy group
+        """
+        mObjHandle_categoryGroup = self._categoryGroupCache.get(category)
+        if mObjHandle_categoryGroup is not None and mObjHandle_categoryGroup.isValid():
+            mObj_categoryGroup = mObjHandle_categoryGroup.object()
+            mFnDag_categoryGroup = om2.MFnDagNode(mObj_categoryGroup)
+            if mFnDag_categoryGroup.name() == category.name and mFnDag_categoryGroup.parentCount() and mFnDag_categoryGroup.parent(0) == self._mObj_node:
+                return mObj_categoryGroup
+
+        mObj_categoryGroup = self.getChildByName(category.name)
+        self._categoryGroupCache[category] = om2.MObjectHandle(mObj_categoryGroup)
+        return mObj_categoryGroup
+
     def hasCategoryGroup(self, category):
-        return self.hasChildWithName(category.name)
+        try:
+            self._getCategoryGroupMObject(category)
+        except RuntimeError:
+            return False
+
+        return True
 
     def getCategoryGroup(self, category, asMeta=False):
-        return self.getChildByName(category.name)
+        mObj_categoryGroup = self._getCategoryGroupMObject(category)
+        return BASE.getMNode(mObj_categoryGroup) if asMeta else mObj_categoryGroup
 
     def hasMember(self, member):
         try:
@@ -873,7 +1288,7 @@ class MRS_Component(BASE.MetaDag):
         return mObj_component == self.mObj_node
 
     def getMembers(self, asMeta=False):
-        mObjArray_members = self._mFnContainer.getMembers()
+        mObjArray_members = self.mFnContainer.getMembers()
         if asMeta:
             return [BASE.getMeta(mObj_member) for mObj_member in mObjArray_members]
         else:
@@ -881,29 +1296,24 @@ class MRS_Component(BASE.MetaDag):
 
     def getDagMembers(self, category, asMeta=False):
         try:
-            mNode_categoryGroup = self.getChildByName(category.name)
+            mNode_categoryGroup = self.getCategoryGroup(category, asMeta=True)
         except RuntimeError:
             return []
 
         return mNode_categoryGroup.getRelativeNodes(descendants=True, asMeta=asMeta)
 
     def getRegisteredMembers(self, category, classification="member", asMeta=False):
-        arrayBaseName = MRS_Component.MEMBER_REGISTRATION_NAMING_CONVENTION.format(category=category.name, classification=classification)
-        try:
-            return self.messageArray_nodes(arrayBaseName, asMeta=asMeta)
-        except AttributeError:
+        # Unregistered categories are expected, the array is tested for rather than relying upon an exception
+        arrayBaseName = self._getRegistrationArrayName(category, classification)
+        if not self.messageArray_exists(arrayBaseName):
             return []
 
-    def getNamedMembers(self, category, asMeta=False):
-        categoryName = category.name
-        mObjs_members = self.getMembers()
-        mObjs_namedMembers = []
+        return self.messageArray_nodes(arrayBaseName, asMeta=asMeta)
 
-        for mObj_member in mObjs_members:
-            shortName = NAME.getNodeShortName(mObj_member)
-            shortNameTokens = shortName.split("_")
-            if categoryName in shortNameTokens:
-                mObjs_namedMembers.append(mObj_member)
+    def getNamedMembers(self, category, asMeta=False):
+        searchCategoryToken = _CATEGORY_TOKEN_RE[category].search
+        getNodeShortName = NAME.getNodeShortName
+        mObjs_namedMembers = [mObj_member for mObj_member in self._getMemberMObjects() if searchCategoryToken(getNodeShortName(mObj_member))]
 
         if asMeta:
             return [BASE.getMeta(mObj_member) for mObj_member in mObjs_namedMembers]
@@ -913,28 +1323,22 @@ class MRS_Component(BASE.MetaDag):
     # --- Extrospect ----------------------------------------------------------------------------
 
     def getInputComponents(self, asMeta=True):
-        mObjs_inputComponents = []
-        mNodes_inputMembers = self.getDagMembers(MRS_Component.Category.input, asMeta=True)
+        mObjs_inputMembers = self._categorizeMembers()[MRS_Component.Category.input]
 
-        for mNode_inputMember in mNodes_inputMembers:
-            for mObj_inputMemberInput in mNode_inputMember.iterInputNodes():
-                mObj_inputComponent = getComponentFromMember(mObj_inputMemberInput, asMeta=False)
-                if mObj_inputComponent not in mObjs_inputComponents:
-                    mObjs_inputComponents.append(mObj_inputComponent)
+        # Each input node is resolved to its component once, regardless of how many of its plugs are connected
+        mObjs_inputMemberInputs = _uniqueMObjects(mPlug_source.node() for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_inputMembers, directionType=om2.MItDependencyGraph.kUpstream))
+        mObjs_inputComponents = _uniqueMObjects(getComponentFromMember(mObj_inputMemberInput, asMeta=False) for mObj_inputMemberInput in mObjs_inputMemberInputs)
 
         if asMeta:
             return [MRS_Component(mObj_inputComponent) for mObj_inputComponent in mObjs_inputComponents]
         return mObjs_inputComponents
 
     def getOutputComponents(self, asMeta=True):
-        mObjs_outputComponents = []
-        mNodes_outputMembers = self.getDagMembers(MRS_Component.Category.output, asMeta=True)
+        mObjs_outputMembers = self._categorizeMembers()[MRS_Component.Category.output]
 
-        for mNode_outputMember in mNodes_outputMembers:
-            for mObj_outputMemberoutput in mNode_outputMember.iterOutputNodes():
-                mObj_outputComponent = getComponentFromMember(mObj_outputMemberoutput, asMeta=False)
-                if mObj_outputComponent not in mObjs_outputComponents:
-                    mObjs_outputComponents.append(mObj_outputComponent)
+        # Each output node is resolved to its component once, regardless of how many of its plugs are connected
+        mObjs_outputMemberOutputs = _uniqueMObjects(mPlug_dest.node() for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_outputMembers, directionType=om2.MItDependencyGraph.kDownstream))
+        mObjs_outputComponents = _uniqueMObjects(getComponentFromMember(mObj_outputMemberOutput, asMeta=False) for mObj_outputMemberOutput in mObjs_outputMemberOutputs)
 
         if asMeta:
             return [MRS_Component(mObj_outputComponent) for mObj_outputComponent in mObjs_outputComponents]
@@ -957,9 +1361,12 @@ class MRS_Component(BASE.MetaDag):
         except RuntimeError:
             pass
         else:
-            if type(parentMNode) is BASE.getMTypes().MRS_Rig:
+            # The registry is resolved once, the parent type is compared against both candidates
+            mTypes = BASE.getMTypes()
+            parentMType = type(parentMNode)
+            if parentMType is mTypes.MRS_Rig:
                 return parentMNode
-            if type(parentMNode) is BASE.getMTypes().MRS_Module:
+            if parentMType is mTypes.MRS_Module:
                 try:
                     return parentMNode.getRig()
                 except RuntimeError:
@@ -976,90 +1383,66 @@ class MRS_Component(BASE.MetaDag):
         mObj_categoryGroup = DAG.createNode()
         self.addChild(mObj_categoryGroup)
         DG.remameNode(mObj_categoryGroup, category.name)
+        self._categoryGroupCache[category] = om2.MObjectHandle(mObj_categoryGroup)
 
     @DECORATOR.undoOnError(StandardError)
     def addMembers(self, members=None, selected=False, force=True):
-        mObjs_members = []
-
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
-
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+        mObjs_members = _coerceMembers(members, selected)
 
         # Validate
         componentDescription = MRS_Component.generateComponentDescription(
             userType=self.userType, locality=self.locality, userSubType=self.userSubType, index=self.index)
 
+        # Loop invariant lookups are bound locally
+        getNodeShortName = NAME.getNodeShortName
+        kDagNode = om2.MFn.kDagNode
+
         for mObj_member in mObjs_members:
-            if mObj_member.hasFn(om2.MFn.kDagNode):
+            if mObj_member.hasFn(kDagNode):
                 raise RuntimeError("MRS_Component : {} : DAG node must be parented to component, not added (see parentMembers)".format(NAME.getNodeFullName(mObj_member)))
-            if not NAME.getNodeShortName(mObj_member).startswith(componentDescription):
+            if not getNodeShortName(mObj_member).startswith(componentDescription):
                 raise RuntimeError("MRS_Component : {} : Node has invalid member name, must begin with component description : {}".format(
                     NAME.getNodeFullName(mObj_member), componentDescription))
 
         # Add members to container
-        memberNames = set()
-        for mObj_member in mObjs_members:
-            memberNames.append(NAME.getNodeFullName(mObj_member))
+        memberNames = [NAME.getNodeFullName(mObj_member) for mObj_member in mObjs_members]
 
         cmds.container(self.partialPathName, edit=True, addNode=memberNames, force=force)
 
-    def parentMembers(self, category, members=None, selected=False):
-        mNode_categoryGroup = self.getCategoryGroup(category)
-        mObjs_members = []
-
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
+        # Container membership has changed for these members
+        for mObj_member in mObjs_members:
+            _componentFromMemberCache.pop(om2.MObjectHandle(mObj_member).hashCode(), None)
 
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+    def parentMembers(self, category, members=None, selected=False):
+        mNode_categoryGroup = self.getCategoryGroup(category, asMeta=True)
+        mObjs_members = _coerceMembers(members, selected)
 
         # Validate
         componentDescription = MRS_Component.generateComponentDescription(
             userType=self.userType, locality=self.locality, userSubType=self.userSubType, index=self.index)
 
+        # Loop invariant lookups are bound locally, descendant names are checked until the first invalid prefix
+        getNodeShortName = NAME.getNodeShortName
+        kDagNode = om2.MFn.kDagNode
+
         for mObj_member in mObjs_members:
-            if not mObj_member.hasFn(om2.MFn.kDagNode):
+            if not mObj_member.hasFn(kDagNode):
                 raise RuntimeError("MRS_Component : {} : Non-DAG nodes must be added to component, not parented (see addMembers) ".format(NAME.getNodeFullName(mObj_member)))
-            if not NAME.getNodeShortName(mObj_member).startswith(componentDescription):
+            if not getNodeShortName(mObj_member).startswith(componentDescription):
                 raise RuntimeError("MRS_Component : {} : Node has invalid member name, must begin with component description : {}".format(
                     NAME.getNodeFullName(mObj_member), componentDescription))
-            for mObj_descendant in DAG.iterDescendants(mObj_member):
-                if not NAME.getNodeShortName(mObj_descendant).startswith(componentDescription):
-                    raise RuntimeError("MRS_Component : {} : Cannot parent node which has a descendant with an invalid member name, all descendants must begin with component description : {}".format(
-                        NAME.getNodeFullName(mObj_member), componentDescription))
+            if not all(descendantShortName.startswith(componentDescription) for descendantShortName in _iterDescendantShortNames(mObj_member)):
+                raise RuntimeError("MRS_Component : {} : Cannot parent node which has a descendant with an invalid member name, all descendants must begin with component description : {}".format(
+                    NAME.getNodeFullName(mObj_member), componentDescription))
 
         # Parent members to category group
-        for index, mObj_member in enumerate(mObjs_members):
-            if mObj_member not in mObjs_members[:index]:
-                mNode_categoryGroup.addChild(mObj_member)
+        for mObj_member in mObjs_members:
+            mNode_categoryGroup.addChild(mObj_member)
 
     # --- Remove ------------------------------------------------------------------------------------
 
     def removeMembers(self, members=None, selected=False):
-        mObjs_members = []
-
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
-
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+        mObjs_members = _coerceMembers(members, selected)
 
         # Validate
         for mObj_member in mObjs_members:
@@ -1070,30 +1453,23 @@ class MRS_Component(BASE.MetaDag):
         self.deregisterMembersFromAll(members=mObjs_members)
 
         # Remove members from container
-        memberNames = set()
-        for mObj_member in mObjs_members:
-            memberNames.add(NAME.getNodeFullName(mObj_member))
+        memberNames = [NAME.getNodeFullName(mObj_member) for mObj_member in mObjs_members]
 
         cmds.container(self.partialPathName, edit=True, removeNode=memberNames)
 
-    def unparentMembers(self, category, members=None, selected=False):
-        mNode_categoryGroup = self.getCategoryGroup(category)
-        mObjs_members = []
-
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
+        # Container membership has changed for these members
+        for mObj_member in mObjs_members:
+            _componentFromMemberCache.pop(om2.MObjectHandle(mObj_member).hashCode(), None)
 
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+    def unparentMembers(self, category, members=None, selected=False):
+        mNode_categoryGroup = self.getCategoryGroup(category, asMeta=True)
+        mObjs_members = _coerceMembers(members, selected)
 
         # Validate
+        kDagNode = om2.MFn.kDagNode
+
         for mObj_member in mObjs_members:
-            if not mObj_member.hasFn(om2.MFn.kDagNode):
+            if not mObj_member.hasFn(kDagNode):
                 raise RuntimeError("MRS_Component : {} : Non-DAG node must be removed from component, not unparented (see removeMembers)".format(
                     NAME.getNodeFullName(mObj_member)))
             if not mNode_categoryGroup.hasChild(mObj_member):
@@ -1101,18 +1477,17 @@ class MRS_Component(BASE.MetaDag):
                     mNode_categoryGroup.partialPathName, NAME.getNodeFullName(mObj_member)))
 
         # Ensure each member is deregistered from all arrays
-        mObjs_membersToDeregister = mObjs_members
-        for mObj_member in mObjs_members:
-            mObjs_membersToDeregister += DAG.iterDescendants(mObj_member)
+        mObjs_membersToDeregister = list(itertools.chain(mObjs_members, itertools.chain.from_iterable(
+            DAG.iterDescendants(mObj_member) for mObj_member in mObjs_members)))
         self.deregisterMembersFromAll(members=mObjs_membersToDeregister)
 
         # Unparent members from container
-        for index, mObj_member in enumerate(mObjs_members):
-            if mObj_member not in mObjs_members[:index]:
-                DAG.absoluteReparent(mObj_member, parent=None)
+        for mObj_member in mObjs_members:
+            DAG.absoluteReparent(mObj_member, parent=None)
 
     # --- Register ------------------------------------------------------------------------------------
 
+    @DECORATOR.undoOnError(StandardError)
     def registerMembers(self, category, classification="member", members=None, selected=False):
         """
         Provides a way to register a group of related nodes which can later be retrieved using the assigned category and classification
@@ -1120,21 +1495,11 @@ class MRS_Component(BASE.MetaDag):
 
         :param <classification>      [str] Eg. member, hierarchy, settings, parameters, buffers, transforms, shapes
         """
-        mObjs_members = []
-
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
-
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+        # Members are consumed once by either branch, therefore they are coerced lazily rather than collected into a list
+        mObjs_members = _iterCoercedMembers(members, selected)
 
         # The array will ensure duplicate entries are not created (ie. no current need to check)
-        arrayBaseName = MRS_Component.MEMBER_REGISTRATION_NAMING_CONVENTION.format(category=category.name, classification=classification)
+        arrayBaseName = self._getRegistrationArrayName(category, classification)
         if self.messageArray_exists(arrayBaseName):
             self.messageArray_connect(mObjs_members)
         else:
@@ -1142,70 +1507,68 @@ class MRS_Component(BASE.MetaDag):
 
     @DECORATOR.undoOnError(StandardError)
     def deregisterMembers(self, category, classification="member", members=None, selected=False):
-        mObjs_members = []
+        mObjs_members = _iterCoercedMembers(members, selected)
+        self._removeRegisteredMObjects(self._getRegistrationArrayName(category, classification), mObjs_members)
 
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
+    def _removeRegisteredMObjects(self, arrayBaseName, mObjs_members):
+        """
+        Removes each of the given members from the registration array with the given base name
+        Members must already be unique MObjects (see _iterCoercedMembers), therefore each is only removed from the array once
+        """
+        messageArray_remove = self.messageArray_remove
+        for mObj_member in mObjs_members:
+            messageArray_remove(arrayBaseName, mObj_member)
 
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
+    @DECORATOR.undoOnError(StandardError)
+    def deregisterMembersFromAll(self, members=None, selected=False):
+        mObjs_members = _coerceMembers(members, selected)
+        if not mObjs_members:
+            return
 
-        # Ensure we only ever attempt to remove a member from the array once
-        arrayBaseName = MRS_Component.MEMBER_REGISTRATION_NAMING_CONVENTION.format(category=category.name, classification=classification)
-        for index, mObj_member in enumerate(mObjs_members):
-            if mObj_member not in mObjs_members[:index]:
-                self.messageArray_remove(arrayBaseName, mObj_member)
+        mObjs_membersByHashCode = {om2.MObjectHandle(mObj_member).hashCode(): mObj_member for mObj_member in mObjs_members}
 
-    def deregisterMembersFromAll(self, members=None, selected=False):
-        mObjs_members = []
+        # Registration attributes are traversed once from the component side, rather than walking the message destinations of each member
+        # Members are first grouped by the base name of each registration array, each distinct base name is then parsed once
+        mObjs_membersByArrayName = {}
+        setdefault = mObjs_membersByArrayName.setdefault
+        for mPlug_registration in om2.MFnDependencyNode(self._mObj_node).getConnections():
+            if not mPlug_registration.isDestination or mPlug_registration.isChild or mPlug_registration.isElement:
+                continue
 
-        if members is not None:
-            if isinstance(members, om2.MObject):
-                mObjs_members = [members]
-            elif issubclass(type(members), BASE.Meta):
-                mObjs_members = [members.mObj_node]
-            else:
-                mObjs_members = [member if isinstance(member, om2.MObject) else member.mObj_node for member in members]
-
-        if selected:
-            mObjs_members += list(DG.iterSelectedNodes())
-
-        deregistrationDict = defaultdict(list)
-        for index, mObj_member in enumerate(mObjs_members):
-            if mObj_member not in mObjs_members[:index]:
-                mPlug_memberMessage = om2.MFnDependencyNode(mObj_member).findPlug("message", False)
-                mPlugs_messageDest = mPlug_memberMessage.destinationsWithConversions()
-                for mPlug_messageDest in mPlugs_messageDest:
-                    if mPlug_messageDest.node() == self.mObj_node:
-                        if not mPlug_messageDest.isChild and not mPlug_messageDest.isElement:
-                            attrName = om2.MFnAttribute(mPlug_messageDest.attribute()).name
-                            attrNameTokens = attrName.split("_")
-                            if not len(attrNameTokens) == 3:
-                                continue
-                            try:
-                                category = MRS_Component.Category[attrNameTokens[0]]
-                                classification = attrNameTokens[1]
-                            except KeyError:
-                                continue
-                            try:
-                                int(tokens[2])
-                            except ValueError:
-                                continue
-
-                            deregistrationDict[(category, classification)].append(mObj_member)
-
-        for (category, classification), mObjs_members in deregistrationDict.iteritems():
-            self.deregisterMembers(category=category, classification=classification, members=mObjs_members)
+            mPlug_source = mPlug_registration.sourceWithConversion()
+            if mPlug_source.isNull or not _isMessagePlug(mPlug_source):
+                continue
+
+            mObj_member = mObjs_membersByHashCode.get(om2.MObjectHandle(mPlug_source.node()).hashCode())
+            if mObj_member is None:
+                continue
+
+            arrayBaseName, _, index = om2.MFnAttribute(mPlug_registration.attribute()).name.rpartition("_")
+            if not index.isdigit():
+                continue
+
+            setdefault(arrayBaseName, []).append(mObj_member)
+
+        # Each bucket already holds MObjects and the base name of its array, members are only deduplicated as they may occupy multiple elements
+        for arrayBaseName, mObjs_registeredMembers in mObjs_membersByArrayName.iteritems():
+            match = _REGISTRATION_ARRAY_RE.match(arrayBaseName)
+            if match is None or match.group("category") not in _CATEGORY_BY_NAME:
+                continue
+
+            self._removeRegisteredMObjects(arrayBaseName, _uniqueMObjects(mObjs_registeredMembers))
 
     # --- Naming ----------------------------------------------------------------------------------
 
     @classmethod
     def generateComponentDescription(cls, userType, locality, userSubType=None, index=None):
+        # Descriptions are cached against the naming convention and tokens they are composed from
+        # Only valid tokens are ever cached, therefore validation is deferred until a lookup misses
+        cacheKey = (cls.COMPONENT_DESCRIPTION_NAMING_CONVENTION, userType, locality, userSubType, index)
+        return _memoize(_componentDescriptionCache, _COMPONENT_DESCRIPTION_CACHE_SIZE, cacheKey, cls._composeComponentDescription, userType, locality, userSubType, index)
+
+    @classmethod
+    def _composeComponentDescription(cls, userType, locality, userSubType, index):
+        """Returns the component description for the given tokens after validating them (see generateComponentDescription)"""
         # Check the required COMPONENT_DESCRIPTION_NAMING_CONVENTION tokens
         if not userType:
             raise ValueError("MRS_Component : userType was not given but is required to name the component")
@@ -1215,14 +1578,27 @@ class MRS_Component(BASE.MetaDag):
             raise ValueError("MRS_Component : Given index must be greater or equal to 1")
 
         userSubType = "" if userSubType is None else userSubType
-        indexStr = "" if index is None else str(index).zfill(2)
-        return re.sub(r'(.)\1+', r'\1', cls.COMPONENT_DESCRIPTION_NAMING_CONVENTION.format(
+        indexStr = "" if index is None else "%02d" % index
+        return _REPEATED_CHARACTER_RE.sub(r'\1', cls.COMPONENT_DESCRIPTION_NAMING_CONVENTION.format(
             userType=userType, locality=locality, userSubType=userSubType, index=indexStr))
 
     @classmethod
     def generateComponentName(cls, userType, locality, userSubType=None, index=None):
         description = cls.generateComponentDescription(userType=userType, locality=locality, userSubType=userSubType, index=index)
-        return cls.COMPONENT_NAMING_CONVENTION.format(description=description)
+        return cls._formatComponentName(description)
+
+    @classmethod
+    def _formatComponentName(cls, description):
+        """Returns the component name for a given component description, formatted names are cached against the naming convention"""
+        cacheKey = (cls.COMPONENT_NAMING_CONVENTION, description)
+        return _memoize(_componentNameCache, _COMPONENT_NAME_CACHE_SIZE, cacheKey, cls.COMPONENT_NAMING_CONVENTION.format, description=description)
+
+    @classmethod
+    def _getRegistrationArrayName(cls, category, classification):
+        """Returns the base name of the message array used to register members for a given category and classification, formatted names are cached against the naming convention"""
+        cacheKey = (cls.MEMBER_REGISTRATION_NAMING_CONVENTION, category.name, classification)
+        return _memoize(_registrationArrayNameCache, _REGISTRATION_ARRAY_NAME_CACHE_SIZE, cacheKey,
+                        cls.MEMBER_REGISTRATION_NAMING_CONVENTION.format, category=category.name, classification=classification)
 
     def generateMemberName(self, warble):
         if not warble:
@@ -1232,8 +1608,8 @@ class MRS_Component(BASE.MetaDag):
         return MRS_Component.MEMBER_NAMING_CONVENTION.format(description=description, warble=warble)
 
     def createFileName(self, modification):
-        majorVersion = str(self.majorVersion).zfill(3)
-        minorVersion = str(self.minorVersion).zfill(3)
+        majorVersion = "%03d" % self.majorVersion
+        minorVersion = "%03d" % self.minorVersion
         if wip:
             fileName = MRS_Component.WIP_FILE_NAMING_CONVENTION.format(
                 componentType=self.componentType, majorVersion=majorVersion, minorVersion=minorVersion, modification=modification)
@@ -1244,14 +1620,22 @@ class MRS_Component(BASE.MetaDag):
 
     @DECORATOR.undoOnError(StandardError)
     def rename(self, userType=None, locality=None, userSubType=None, index=None):
-        userType = userType if userType is not None else self.userType
-        locality = locality if locality is not None else self.locality
-        userSubType = userSubType if userSubType is not None else self.userSubType
-        index = index if index is not None else self.index
+        if userType is None and locality is None and userSubType is None and index is None:
+            return
+
+        # Current name data is read once and shared by the change test, the old description and the attribute updates
+        oldUserType, oldLocality, oldUserSubType, oldIndex = self.userType, self.locality, self.userSubType, self.index
+        userType = userType if userType is not None else oldUserType
+        locality = locality if locality is not None else oldLocality
+        userSubType = userSubType if userSubType is not None else oldUserSubType
+        index = index if index is not None else oldIndex
+
+        if userType == oldUserType and locality == oldLocality and userSubType == oldUserSubType and index == oldIndex:
+            return
 
-        oldDescription = MRS_Component.generateComponentDescription(userType=self.userType, locality=self.locality, userSubType=self.userSubType, index=self.index)
+        oldDescription = MRS_Component.generateComponentDescription(userType=oldUserType, locality=oldLocality, userSubType=oldUserSubType, index=oldIndex)
         newDescription = MRS_Component.generateComponentDescription(userType=userType, locality=locality, userSubType=userSubType, index=index)
-        newComponentName = MRS_Component.COMPONENT_NAMING_CONVENTION.format(description=newDescription)
+        newComponentName = MRS_Component._formatComponentName(newDescription)
 
         if oldDescription == newDescription:
             return
@@ -1260,44 +1644,59 @@ class MRS_Component(BASE.MetaDag):
         if self.shortName != newComponentName:
             raise RuntimeError("MRS_Component : {} : Unable to rename component, node already exists : {}".format(self.partialPathName, newComponentName))
 
-        mObjs_members = self.getMembers()
-        for mObj_member in mObjs_members:
-            oldMemberName = NAME.getNodeShortName(mObj_member)
+        # Loop invariant values are computed once, the children are only retrieved if a member does not carry the old description
+        getNodeShortName = NAME.getNodeShortName
+        renameNode = DG.renameNode
+        oldDescriptionLength = len(oldDescription)
+        hashCodes_children = None
+
+        for mObj_member in self._getMemberMObjects():
+            oldMemberName = getNodeShortName(mObj_member)
             if oldMemberName.startswith(oldDescription):
-                newMemberName = newDescription + oldMemberName[len(oldDescription):]
-            elif mObj_member.hasFn(om2.MFn.kTransform) and self.hasChildWithName(oldMemberName):
-                try:
-                    MRS_Component.Category[oldMemberName]
+                newMemberName = newDescription + oldMemberName[oldDescriptionLength:]
+            elif mObj_member.hasFn(om2.MFn.kTransform):
+                if hashCodes_children is None:
+                    hashCodes_children = {om2.MObjectHandle(mObj_child).hashCode() for mObj_child in self.iterChildren()}
+
+                if om2.MObjectHandle(mObj_member).hashCode() not in hashCodes_children:
+                    self.inspectNaming()
+                    raise RuntimeError("MRS_Component : {} : Component has member with invalid name, see log info".format(self.partialPathName))
+                if oldMemberName in _CATEGORY_BY_NAME:
                     continue
-                except KeyError:
+                else:
                     self.inspectNaming()
                     raise RuntimeError("MRS_Component : {} : Component has category hierarchy group with invalid name, see log info".format(self.partialPathName))
             else:
                 self.inspectNaming()
                 raise RuntimeError("MRS_Component : {} : Component has member with invalid name, see log info".format(self.partialPathName))
 
-            DG.renameNode(mObj_member, newMemberName)
-            if NAME.getNodeShortName(mObj_member) != newMemberName:
+            renameNode(mObj_member, newMemberName)
+            if getNodeShortName(mObj_member) != newMemberName:
                 raise RuntimeError("MRS_Component : {} : Unable to rename component member : {}. Node already exists : {}".format(
                     self.partialPathName, oldMemberName, newMemberName))
 
-        if userType != self.userType:
+        if userType != oldUserType:
             self.getAttr("userType").set(userType)
-        if locality != self.locality:
+        if locality != oldLocality:
             self.getAttr("locality").set(locality)
-        if userSubType != self.userSubType:
+        if userSubType != oldUserSubType:
             self.getAttr("userSubType").set(userSubType)
-        if index != self.index:
+        if index != oldIndex:
             self.getAttr("index").set(index)
 
     # --- Select ----------------------------------------------------------------------------------
 
     def selectMembers(self, addFirst=False, add=False):
-        mObjs_members = self.getMembers()
-        mSel_members = om2.MSelectionList()
+        mObjArray_members = self._getMemberMObjects()
 
-        for mObj_member in mObjs_members:
-            mSel_members.add(mObj_member)
+        # Adding nothing to the active selection is a no-op, replacing it with nothing still clears it
+        if not len(mObjArray_members) and (addFirst or add):
+            return
+
+        mSel_members = om2.MSelectionList()
+        addToSelection = mSel_members.add
+        for mObj_member in mObjArray_members:
+            addToSelection(mObj_member)
 
         if addFirst:
             om2.MGlobal.setActiveSelectionList(mSel_members, listAdjustment=om2.MGlobal.kAddToHeadOfList)
@@ -1310,25 +1709,27 @@ class MRS_Component(BASE.MetaDag):
 
     def updateGuideTracking(self):
         # Method relies upon the unenforced guide naming rule
-        mNodes_guideMembers = self.getNamedMembers(MRS_Component.Category.guide, asMeta=True)
-        mObjs_guideMembers = [mNode_guideMember.mObj_node for mNode_guideMember in mNodes_guideMembers]
-        mObjs_inputMembers = self.getDagMembers(MRS_Component.Category.input)
-        mObjs_guidedMembers = self.getDagMembers(MRS_Component.Category.guided)
-
-        for mNode_guideMember in mNodes_guideMembers:
-            for mAttr_source, mAttr_dest in mNode_guideMember.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kUpstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_source.mObj_node not in mObjs_guideMembers:
-                    if mAttr_source.mObj_node in mObjs_inputMembers:
-
-                    else:
-                        self.inspectGuide()
-                        raise RuntimeError("MRS_Component : {} : Component does not have a valid guide, see log info".format(self.partialPathName))
-
-            for mAttr_source, mAttr_dest in mNode_guideMember.mNode_guideMember.iterDependenciesByEdge(directionType=om2.MItDependencyGraph.kDownstream, walk=False, pruneMessage=True, asMeta=True):
-                if mAttr_dest.mObj_node not in mObjs_guideMembers and mAttr_dest.mObj_node not in mObjs_guidedMembers:
-                    hasValidGuide = False
-                    log.info("MRS_Component : {} : Component guide node has invalid output connection : {} -> {}".format(
-                        self.partialPathName, mAttr_source.partialPathName, mAttr_dest.partialPathName))
+        mObjs_guideMembers = self.getNamedMembers(MRS_Component.Category.guide)
+        mObjs_dagMembersByCategory = self._categorizeMembers()
+        hashCodes_inputMembers = {om2.MObjectHandle(mObj_inputMember).hashCode() for mObj_inputMember in mObjs_dagMembersByCategory[MRS_Component.Category.input]}
+        mObjs_permittedOutputs = mObjs_guideMembers + mObjs_dagMembersByCategory[MRS_Component.Category.guided]
+
+        # Edges between guide members are excluded up front so that only external dependencies are visited
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kUpstream, excludeNodes=mObjs_guideMembers):
+            if _isMessagePlug(mPlug_source):
+                continue
+
+            if om2.MObjectHandle(mPlug_source.node()).hashCode() in hashCodes_inputMembers:
+                # Tracking of input dependencies is not yet implemented
+                pass
+            else:
+                self.inspectGuide()
+                raise RuntimeError("MRS_Component : {} : Component does not have a valid guide, see log info".format(self.partialPathName))
+
+        for mPlug_source, mPlug_dest in DG.getDirectEdges(mObjs_guideMembers, directionType=om2.MItDependencyGraph.kDownstream, excludeNodes=mObjs_permittedOutputs):
+            if not _isMessagePlug(mPlug_source):
+                log.info("MRS_Component : {} : Component guide node has invalid output connection : {} -> {}".format(
+                    self.partialPathName, NAME.getPlugPartialName(mPlug_source), NAME.getPlugPartialName(mPlug_dest)))
 
     def toggleGuide(self):
         pass
@@ -1348,6 +1749,10 @@ class MRS_Component(BASE.MetaDag):
         if self.isAsset:
             raise RuntimeError("MRS_Component : {} : Assetised component cannot be exported, deassetise to export changes".format(self.partialPathName))
 
+        # Only required when exporting, deferred to avoid the cost when the module is imported for querying components
+        from datetime import datetime
+        import getpass
+
         if author is None:
             if not self.author:
                 self.author = getpass.getuser()
@@ -1356,29 +1761,32 @@ class MRS_Component(BASE.MetaDag):
 
         self.creationDate = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
+        # Version numbers are read once, the updated values are tracked locally for the modification checks and file name
+        majorVersion, minorVersion = self.majorVersion, self.minorVersion
         if incrementMajorVersion:
-            self.majorVersion = self.majorVersion + 1
-            self.minorVersion = 0
+            majorVersion, minorVersion = majorVersion + 1, 0
+            self.majorVersion = majorVersion
+            self.minorVersion = minorVersion
         elif incrementMinorVersion:
-            self.minorVersion = self.minorVersion + 1
+            minorVersion = minorVersion + 1
+            self.minorVersion = minorVersion
 
         # We check if a modification string was given even if the minor version is 0 (ie. the user could attempt to override the initial export)
-        if self.minorVersion == 0 and not modification:
-            if self.majorVersion == 1:
+        if minorVersion == 0 and not modification:
+            if majorVersion == 1:
                 modification = "new"
             else:
                 modification = "deassetized"
         else:
             modification = "update" if not modification else modification
 
-        majorVersion = str(self.majorVersion).zfill(3)
-        minorVersion = str(self.minorVersion).zfill(3)
         fileName = MRS_Component.WIP_FILE_NAMING_CONVENTION.format(
-            componentType=self.componentType, majorVersion=majorVersion, minorVersion=minorVersion, modification=modification)
+            componentType=self.componentType, majorVersion="%03d" % majorVersion, minorVersion="%03d" % minorVersion, modification=modification)
         filePath = MRS_Component.WIP_PATH_NAMING_CONVENTION.format(
             MRS_COMPONENT_PATH=getComponentPath(), componentType=self.componentType, fileName=fileName)
 
         self.fileName = fileName
+        self._filePathCache = None
 
     # --- Assetise ------------------------------------------------------------------------------
 
@@ -1394,5 +1802,19 @@ class MRS_Component(BASE.MetaDag):
         pass
 
 
+# ----------------------------------------------------------------------------
+# --- Setup ---
+# ----------------------------------------------------------------------------
+
+# Search filter for listComponents, resolved once at import rather than on each call
+_COMPONENT_MTYPE_BASES = (MRS_Component,)
+
+# Maps the name of each category hierarchy group to its Category, used in place of Category name lookups which raise a KeyError for invalid names
+_CATEGORY_BY_NAME = {category.name: category for category in MRS_Component.Category}
+_CATEGORY_NAMES = frozenset(_CATEGORY_BY_NAME)
+
+# Maps each Category to a pattern matching its name as an underscore separated token of a node name (see MRS_Component.getNamedMembers)
+_CATEGORY_TOKEN_RE = {category: re.compile(r"(?:^|_)" + re.escape(category.name) + r"(?:_|$)") for category in MRS_Component.Category}
+
 BASE.registerMTypeEnumeration()
 BASE.registerMNodeTypes(nTypes={"dagContainer": om2.MFn.kDagContainer})
@@ -8,8 +8,6 @@ This framework enforces a specific structure which is designed to create extensi
 --------------------------------
 """
 
-from maya.api import OpenMaya as om2
-
 from msTools.metadata import base as BASE
 
 
@@ -25,7 +23,7 @@ def iterRigs(asMeta=True):
 
     :yield                      [mNode] The retrieved mNodes, as MObjects or instantiated mClass objects
     """
-    return BASE.iterMetaNodes(mTypeBases=META_TYPE.MRS_Rig, asMeta=asMeta)
+    return BASE.iterMetaNodes(mTypeBases=_RIG_MTYPE_BASES, asMeta=asMeta)
 
 
 def iterConnectedRigs(inputs=None, selected=False, asMeta=True):
@@ -38,7 +36,7 @@ def iterConnectedRigs(inputs=None, selected=False, asMeta=True):
 
     :yield                      [mNode] The retrieved mNodes, as MObjects or instantiated mClass objects
     """
-    return BASE.iterConnectedMNodes(inputs, selected=selected, downstream=True, upstream=True, walk=True, mTypeBases=META_TYPE.MRS_Rig, asMeta=asMeta)
+    return BASE.iterConnectedMNodes(inputs, selected=selected, downstream=True, upstream=True, walk=True, mTypeBases=_RIG_MTYPE_BASES, asMeta=asMeta)
 
 
 def iterRigSystems(asMeta=True):
@@ -49,7 +47,7 @@ def iterRigSystems(asMeta=True):
 
     :yield                      [mNode] The retrieved mNodes, as MObjects or instantiated mClass objects
     """
-    return BASE.iterMetaNodes(mTypeSystems=META_TYPE.MRS_Rig, asMeta=asMeta)
+    return BASE.iterMetaNodes(mSystemIds=_RIG_MSYSTEM_IDS, asMeta=asMeta)
 
 
 def getRigFromNode(node, asMeta=True):
@@ -144,8 +142,8 @@ class MRS_Component(BASE.MetaDag):
 # --- Setup ---
 # ----------------------------------------------------------------------------
 
+# Search filters are resolved once at import rather than on each call (see iterRigs, iterConnectedRigs, iterRigSystems)
+_RIG_MTYPE_BASES = (MRS_Rig,)
+_RIG_MSYSTEM_IDS = (MRS_Rig.mClassSystemID,)
 
-# Update the mType registry
-BASE.registerMTypeEnumeration()
-# Update the node types registry to include DAG container nodes
-BASE.registerMNodeTypes(nTypes={"dagContainer": om2.MFn.kDagContainer})
+# The mType and dagContainer node type registries are updated once by mrs_component (see the Setup section of that module)
@@ -157,16 +157,7 @@ def isCallableRegistered(event, callable_):
     Returns:
         :class:`bool`: True if the callable is registered to the event, False otherwise.
     """
-    isPartial = isinstance(callable_, functools.partial)
-    for registeredCallableData in _CALLBACK_DATA.callableDataRegistry[event]:
-        if isPartial and isinstance(registeredCallableData.callable, functools.partial):
-            if (callable_.func == registeredCallableData.callable.func and callable_.args == registeredCallableData.callable.args
-                    and callable_.keywords == registeredCallableData.callable.keywords):
-                return True
-        elif callable_ == registeredCallableData.callable:
-            return True
-
-    return False
+    return _getCallableKey(callable_) in _CALLBACK_DATA.callableDataRegistry.get(event, ())
 
 
 def registerCallable(event, callable_, receivesCallbackArgs=False):
@@ -189,17 +180,22 @@ def registerCallable(event, callable_, receivesCallbackArgs=False):
     """
     global _CALLBACK_DATA
 
-    if isCallableRegistered(event, callable_):
+    callableData = _CallableData(callable_, receivesCallbackArgs)
+    callableDataRegistry = _CALLBACK_DATA.callableDataRegistry[event]
+    if callableData.key in callableDataRegistry:
         return
 
-    previousCallableCount = len(_CALLBACK_DATA.callableDataRegistry[event])
-    callableData = _CallableData(callable_, receivesCallbackArgs)
-    _CALLBACK_DATA.callableDataRegistry[event].add(callableData)
+    callableDataRegistry[callableData.key] = callableData
+    _updateInvocationRegistries(event)
 
-    if previousCallableCount == 0 and len(_CALLBACK_DATA.callableDataRegistry[event]) == 1:
+    if len(callableDataRegistry) == 1:
         log.debug("Installing: {} callback".format(event))
         registerCallback = _kRegister[event]
-        callbackId = registerCallback()
+        if isinstance(event, UserEvent):
+            callbackId = registerCallback()
+        else:
+            # Message callbacks receive the invocation lists of the event as client data, the lists are updated in place as callables are (de)registered
+            callbackId = registerCallback(clientData=(_CALLBACK_DATA.noArgCallableRegistry[event], _CALLBACK_DATA.argCallableRegistry[event]))
         _CALLBACK_DATA.idRegistry[event] = callbackId
 
 
@@ -214,21 +210,17 @@ def deregisterCallable(event, callable_):
     """
     global _CALLBACK_DATA
 
-    for registeredCallableData in _CALLBACK_DATA.callableDataRegistry[event]:
-        if registeredCallableData.callable == callable_:
-            _CALLBACK_DATA.callableDataRegistry[event].remove(registeredCallableData)
-            break
-        elif isinstance(callable_, functools.partial) and isinstance(registeredCallableData.callable, functools.partial):
-            if (callable_.func == registeredCallableData.callable.func and callable_.args == registeredCallableData.callable.args
-                    and callable_.keywords == registeredCallableData.callable.keywords):
-                _CALLBACK_DATA.callableDataRegistry[event].remove(registeredCallableData)
-                break
-    else:
+    callableDataRegistry = _CALLBACK_DATA.callableDataRegistry[event]
+    try:
+        del callableDataRegistry[_getCallableKey(callable_)]
+    except KeyError:
         log.warning("Callable {} was not found in internal registry".format(callable_))
         return
 
+    _updateInvocationRegistries(event)
+
     # Remove the callback if there are no longer any registered callable
-    if not _CALLBACK_DATA.callableDataRegistry[event]:
+    if not callableDataRegistry:
         callbackId = _CALLBACK_DATA.idRegistry[event]
         deregisterCallback = _kDeregister[type(event)]
         deregisterCallback(callbackId)
@@ -250,21 +242,23 @@ def deregisterCallableByIndex(event, index):
     """
     global _CALLBACK_DATA
 
-    for registeredIndex, registeredCallableData in enumerate(_CALLBACK_DATA.callableDataRegistry[event]):
-        if index == registeredIndex:
-            _CALLBACK_DATA.callableDataRegistry[event].remove(registeredCallableData)
+    callableDataRegistry = _CALLBACK_DATA.callableDataRegistry[event]
+    if not 0 <= index < len(callableDataRegistry):
+        log.warning("There is no callable registered at index: {}".format(index))
+        return
 
-            # Remove the callback if there are no longer any registered callables
-            if not _CALLBACK_DATA.callableDataRegistry[event]:
-                callbackId = _CALLBACK_DATA.idRegistry[event]
-                deregisterCallback = _kDeregister[type(event)]
-                deregisterCallback(callbackId)
-                _CALLBACK_DATA.idRegistry[event] = None
+    # The registry is ordered by registration, therefore the key can be retrieved by position
+    del callableDataRegistry[callableDataRegistry.keys()[index]]
+    _updateInvocationRegistries(event)
 
-                log.debug("Removed: {} callback".format(event))
-            break
-    else:
-        log.warning("There is no callable registered at index: {}".format(index))
+    # Remove the callback if there are no longer any registered callables
+    if not callableDataRegistry:
+        callbackId = _CALLBACK_DATA.idRegistry[event]
+        deregisterCallback = _kDeregister[type(event)]
+        deregisterCallback(callbackId)
+        _CALLBACK_DATA.idRegistry[event] = None
+
+        log.debug("Removed: {} callback".format(event))
 
 
 def reset():
@@ -402,76 +396,107 @@ class _UserEventFilter(QtCore.QObject):
 
 # --- Message Events ---
 
+def _updateInvocationRegistries(event):
+    """Partitions the callables registered to an event by whether they receive callback arguments.
+
+    To be called whenever the ``callableDataRegistry`` of the :data:`_CALLBACK_DATA` registry is modified for an event.
+    The lists for the event are updated in place, in the order of registration.
+
+    Args:
+        event (T <= :class:`Event`): An enumeration of type ``T`` with upper bound :class:`Event`. Corresponds to a Maya message event.
+    """
+    callableDatas = _CALLBACK_DATA.callableDataRegistry[event].values()
+    _CALLBACK_DATA.noArgCallableRegistry[event][:] = [callableData.callable for callableData in callableDatas if not callableData.receivesCallbackArgs]
+    _CALLBACK_DATA.argCallableRegistry[event][:] = [callableData.callable for callableData in callableDatas if callableData.receivesCallbackArgs]
+
+
 def _invokeCallables(event, *args, **kwargs):
     """A generic interface used by callbacks to invoke registered callables.
 
+    Callables which do not receive callback arguments are invoked first, followed by those which do.
+
     Args:
         event (T <= :class:`Event`): An enumeration of type ``T`` with upper bound :class:`Event`. Corresponds to a Maya message event.
             Callables registered to this event will be invoked.
     """
-    for callableData in _CALLBACK_DATA.callableDataRegistry[event]:
-        if callableData.receivesCallbackArgs:
-            callableData.callable(*args, **kwargs)
-        else:
-            callableData.callable()
+    noArgCallables = _CALLBACK_DATA.noArgCallableRegistry.get(event, ())
+    argCallables = _CALLBACK_DATA.argCallableRegistry.get(event, ())
+    if not noArgCallables and not argCallables:
+        return
+
+    _invokeCallableLists((noArgCallables, argCallables), *args, **kwargs)
+
+
+def _invokeCallableLists(callableLists, *args, **kwargs):
+    """Invokes the registered callables of an event, given its invocation lists directly.
+
+    Used by message callbacks which are installed with the invocation lists of an event as client data, avoiding any registry lookup upon invocation.
+
+    Args:
+        callableLists ((:class:`list`, :class:`list`)): A two-element :obj:`tuple`.
+            The first element is the ``noArgCallableRegistry`` list of an event, these callables will be invoked without arguments.
+            The second element is the ``argCallableRegistry`` list of an event, these callables will receive any callback arguments.
+    """
+    noArgCallables, argCallables = callableLists
+
+    for callable_ in noArgCallables:
+        callable_()
+    for callable_ in argCallables:
+        callable_(*args, **kwargs)
 
 
-def _MBasicFunction(*clientData):
+def _MBasicFunction(clientData):
     """A basic callback function.
 
     .. note:: To be used exclusively in the :data:`_kRegister` registry.
 
     Args:
-        clientData (:class:`tuple`): This will always hold just the subclassed :class:`Event` enumeration.
+        clientData ((:class:`list`, :class:`list`)): The invocation lists of the event to which this callback was registered (see :func:`_invokeCallableLists`).
             Callables registered to this event will be invoked.
     """
-    event = clientData[0]
-    _invokeCallables(event)
+    _invokeCallableLists(clientData)
 
 
-def _MStringArrayFunction(strs, *clientData):
+def _MStringArrayFunction(strs, clientData):
     """A callback function that accepts a list of strings.
 
     .. note:: To be used exclusively in the :data:`_kRegister` registry.
 
     Args:
         strs (:class:`list` [:class:`str`]: Generated by the Maya event to which this callback was registered.
-        clientData (:class:`tuple`): This will always hold just the subclassed :class:`Event` enumeration.
+        clientData ((:class:`list`, :class:`list`)): The invocation lists of the event to which this callback was registered (see :func:`_invokeCallableLists`).
             Callables registered to this event will be invoked.
     """
-    event = clientData[0]
-    _invokeCallables(event, strs)
+    _invokeCallableLists(clientData, strs)
 
 
-def _MTimeFunction(time, *clientData):
+def _MTimeFunction(time, clientData):
     """A callback function that accepts an :class:`OpenMaya.MTime` argument.
 
     .. note:: To be used exclusively in the :data:`_kRegister` registry.
 
     Args:
         time (:class:`OpenMaya.MTime`): Generated by the Maya event to which this callback was registered.
-        clientData (:class:`tuple`): This will always hold just the subclassed :class:`Event` enumeration.
+        clientData ((:class:`list`, :class:`list`)): The invocation lists of the event to which this callback was registered (see :func:`_invokeCallableLists`).
             Callables registered to this event will be invoked.
     """
-    event = clientData[0]
-    _invokeCallables(event, time)
+    _invokeCallableLists(clientData, time)
 
 
-def _MNodeFunction(node, *clientData):
+def _MNodeFunction(node, clientData):
     """A callback function that accepts an :class:`OpenMaya.MObject` argument.
 
     .. note:: To be used exclusively in the :data:`_kRegister` registry.
 
     Args:
         node (:class:`OpenMaya.MObject`): Generated by the Maya event to which this callback was registered.
-        clientData (:class:`tuple`): This will always hold just the subclassed :class:`Event` enumeration.
+        clientData ((:class:`list`, :class:`list`)): The invocation lists of the event to which this callback was registered (see :func:`_invokeCallableLists`).
             Callables registered to this event will be invoked.
     """
-    event = clientData[0]
-    _invokeCallables(event, node)
+    _invokeCallableLists(clientData, node)
 
 
-def _MPlugFunction(sourcePlug, destPlug, made, *clientData):
+def _MPlugFunction(sourcePlug, destPlug, made, clientData):
     """A callback function that accepts two :class:`OpenMaya.MPlug` objects and a boolean value.
 
     .. note:: To be used exclusively in the :data:`_kRegister` registry.
@@ -480,14 +505,14 @@ def _MPlugFunction(sourcePlug, destPlug, made, *clientData):
         sourcePlug (:class:`OpenMaya.MObject`): Plug which is the source the connection. Generated by the Maya event to which this callback was registered.
         destPlug (:class:`OpenMaya.MObject`): Plug which is the destination the connection. Generated by the Maya event to which this callback was registered.
         made (bool): True if the connection is being made, False if the connection is being broken. Generated by the Maya event to which this callback was registered.
-        clientData (:class:`tuple`): This will always hold just the subclassed :class:`Event` enumeration.
+        clientData ((:class:`list`, :class:`list`)): The invocation lists of the event to which this callback was registered (see :func:`_invokeCallableLists`).
             Callables registered to this event will be invoked.
     """
-    event = clientData[0]
-    _invokeCallables(event, sourcePlug, destPlug, made)
+    _invokeCallableLists(clientData, sourcePlug, destPlug, made)
 
 
 # Registry used by registerCallable() to register a callable for a specific subclassed Event enumeration to a Maya event
+# Message callbacks are given the invocation lists of the event as client data upon installation (see registerCallable)
 _kRegister = {
     UserEvent.ConfirmedOpen: functools.partial(_addUserEventCallback, beforeMsg=om2.MSceneMessage.kBeforeOpen, afterMsg=om2.MSceneMessage.kAfterOpen, event=UserEvent.ConfirmedOpen, action="Continue"),
     UserEvent.CancelledOpen: functools.partial(_addUserEventCallback, beforeMsg=om2.MSceneMessage.kBeforeOpen, afterMsg=om2.MSceneMessage.kAfterOpen, event=UserEvent.CancelledOpen, action="Cancel"),
@@ -500,40 +525,40 @@ _kRegister = {
     UserEvent.ConfirmedLoadReference: functools.partial(_addUserEventCallback, beforeMsg=om2.MSceneMessage.kBeforeLoadReference, afterMsg=om2.MSceneMessage.kAfterLoadReference, event=UserEvent.ConfirmedLoadReference, action="Continue"),
     UserEvent.CancelledLoadReference: functools.partial(_addUserEventCallback, beforeMsg=om2.MSceneMessage.kBeforeLoadReference, afterMsg=om2.MSceneMessage.kAfterLoadReference, event=UserEvent.CancelledLoadReference, action="Cancel"),
     # ------
-    SceneEvent.SceneUpdate: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kSceneUpdate, _MBasicFunction, clientData=SceneEvent.SceneUpdate),
-    SceneEvent.BeforeNew: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeNew, _MBasicFunction, clientData=SceneEvent.BeforeNew),
-    SceneEvent.AfterNew: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterNew, _MBasicFunction, clientData=SceneEvent.AfterNew),
-    SceneEvent.BeforeOpen: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeOpen, _MBasicFunction, clientData=SceneEvent.BeforeOpen),
-    SceneEvent.AfterOpen: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterOpen, _MBasicFunction, clientData=SceneEvent.AfterOpen),
-    SceneEvent.BeforeImport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeImport, _MBasicFunction, clientData=SceneEvent.BeforeImport),
-    SceneEvent.AfterImport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterImport, _MBasicFunction, clientData=SceneEvent.AfterImport),
-    SceneEvent.BeforeExport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeExport, _MBasicFunction, clientData=SceneEvent.BeforeExport),
-    SceneEvent.AfterExport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterExport, _MBasicFunction, clientData=SceneEvent.AfterExport),
-    SceneEvent.BeforeSave: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeSave, _MBasicFunction, clientData=SceneEvent.BeforeSave),
-    SceneEvent.AfterSave: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterSave, _MBasicFunction, clientData=SceneEvent.AfterSave),
-    SceneEvent.BeforeLoadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeLoadReference, _MBasicFunction, clientData=SceneEvent.BeforeLoadReference),
-    SceneEvent.AfterLoadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterLoadReference, _MBasicFunction, clientData=SceneEvent.AfterLoadReference),
-    SceneEvent.BeforeUnloadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeUnloadReference, _MBasicFunction, clientData=SceneEvent.BeforeUnloadReference),
-    SceneEvent.AfterUnloadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterUnloadReference, _MBasicFunction, clientData=SceneEvent.AfterUnloadReference),
-    SceneEvent.BeforeImportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeImportReference, _MBasicFunction, clientData=SceneEvent.BeforeImportReference),
-    SceneEvent.AfterImportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterImportReference, _MBasicFunction, clientData=SceneEvent.AfterImportReference),
-    SceneEvent.BeforeExportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeExportReference, _MBasicFunction, clientData=SceneEvent.BeforeExportReference),
-    SceneEvent.AfterExportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterExportReference, _MBasicFunction, clientData=SceneEvent.AfterExportReference),
-    SceneEvent.BeforeCreateReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeCreateReference, _MBasicFunction, clientData=SceneEvent.BeforeCreateReference),
-    SceneEvent.AfterCreateReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterCreateReference, _MBasicFunction, clientData=SceneEvent.AfterCreateReference),
-    SceneEvent.BeforeRemoveReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeRemoveReference, _MBasicFunction, clientData=SceneEvent.BeforeRemoveReference),
-    SceneEvent.AfterRemoveReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterRemoveReference, _MBasicFunction, clientData=SceneEvent.AfterRemoveReference),
-    SceneEvent.BeforePluginLoad: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kBeforePluginLoad, _MStringArrayFunction, clientData=SceneEvent.BeforePluginLoad),
-    SceneEvent.AfterPluginLoad: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kAfterPluginLoad, _MStringArrayFunction, clientData=SceneEvent.AfterPluginLoad),
-    SceneEvent.BeforePluginUnload: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kBeforePluginUnload, _MStringArrayFunction, clientData=SceneEvent.BeforePluginUnload),
-    SceneEvent.AfterPluginUnload: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kAfterPluginUnload, _MStringArrayFunction, clientData=SceneEvent.AfterPluginUnload),
+    SceneEvent.SceneUpdate: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kSceneUpdate, _MBasicFunction),
+    SceneEvent.BeforeNew: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeNew, _MBasicFunction),
+    SceneEvent.AfterNew: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterNew, _MBasicFunction),
+    SceneEvent.BeforeOpen: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeOpen, _MBasicFunction),
+    SceneEvent.AfterOpen: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterOpen, _MBasicFunction),
+    SceneEvent.BeforeImport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeImport, _MBasicFunction),
+    SceneEvent.AfterImport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterImport, _MBasicFunction),
+    SceneEvent.BeforeExport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeExport, _MBasicFunction),
+    SceneEvent.AfterExport: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterExport, _MBasicFunction),
+    SceneEvent.BeforeSave: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeSave, _MBasicFunction),
+    SceneEvent.AfterSave: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterSave, _MBasicFunction),
+    SceneEvent.BeforeLoadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeLoadReference, _MBasicFunction),
+    SceneEvent.AfterLoadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterLoadReference, _MBasicFunction),
+    SceneEvent.BeforeUnloadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeUnloadReference, _MBasicFunction),
+    SceneEvent.AfterUnloadReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterUnloadReference, _MBasicFunction),
+    SceneEvent.BeforeImportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeImportReference, _MBasicFunction),
+    SceneEvent.AfterImportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterImportReference, _MBasicFunction),
+    SceneEvent.BeforeExportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeExportReference, _MBasicFunction),
+    SceneEvent.AfterExportReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterExportReference, _MBasicFunction),
+    SceneEvent.BeforeCreateReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeCreateReference, _MBasicFunction),
+    SceneEvent.AfterCreateReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterCreateReference, _MBasicFunction),
+    SceneEvent.BeforeRemoveReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kBeforeRemoveReference, _MBasicFunction),
+    SceneEvent.AfterRemoveReference: functools.partial(om2.MSceneMessage.addCallback, om2.MSceneMessage.kAfterRemoveReference, _MBasicFunction),
+    SceneEvent.BeforePluginLoad: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kBeforePluginLoad, _MStringArrayFunction),
+    SceneEvent.AfterPluginLoad: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kAfterPluginLoad, _MStringArrayFunction),
+    SceneEvent.BeforePluginUnload: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kBeforePluginUnload, _MStringArrayFunction),
+    SceneEvent.AfterPluginUnload: functools.partial(om2.MSceneMessage.addStringArrayCallback, om2.MSceneMessage.kAfterPluginUnload, _MStringArrayFunction),
     # ------
-    DGEvent.TimeChange: functools.partial(om2.MDGMessage.addTimeChangeCallback, _MTimeFunction, clientData=DGEvent.TimeChange),
-    DGEvent.ForceUpdate: functools.partial(om2.MDGMessage.addForceUpdateCallback, _MTimeFunction, clientData=DGEvent.ForceUpdate),
-    DGEvent.NodeAdded: functools.partial(om2.MDGMessage.addNodeAddedCallback, _MNodeFunction, "dependNode", clientData=DGEvent.NodeAdded),
-    DGEvent.NodeRemoved: functools.partial(om2.MDGMessage.addNodeRemovedCallback, _MNodeFunction, "dependNode", clientData=DGEvent.NodeRemoved),
-    DGEvent.ConnectionChange: functools.partial(om2.MDGMessage.addConnectionCallback, _MPlugFunction, clientData=DGEvent.ConnectionChange),
-    DGEvent.PreConnectionChange: functools.partial(om2.MDGMessage.addPreConnectionCallback, _MPlugFunction, clientData=DGEvent.PreConnectionChange),
+    DGEvent.TimeChange: functools.partial(om2.MDGMessage.addTimeChangeCallback, _MTimeFunction),
+    DGEvent.ForceUpdate: functools.partial(om2.MDGMessage.addForceUpdateCallback, _MTimeFunction),
+    DGEvent.NodeAdded: functools.partial(om2.MDGMessage.addNodeAddedCallback, _MNodeFunction, "dependNode"),
+    DGEvent.NodeRemoved: functools.partial(om2.MDGMessage.addNodeRemovedCallback, _MNodeFunction, "dependNode"),
+    DGEvent.ConnectionChange: functools.partial(om2.MDGMessage.addConnectionCallback, _MPlugFunction),
+    DGEvent.PreConnectionChange: functools.partial(om2.MDGMessage.addPreConnectionCallback, _MPlugFunction),
 }
 
 
@@ -549,8 +574,34 @@ _kDeregister = {
 _kEvents = set(CLASS.iterSubclasses(Event))
 
 
+def _getCallableKey(callable_):
+    """Returns a hashable key which identifies a callable object within the :data:`_CALLBACK_DATA` registry.
+
+    Callable objects are keyed by their own value, meaning callables which compare equal (eg. bound methods of the same instance) share a key.
+    :obj:`functools.partial` objects are keyed by their :attr:`~functools.partial.func`, :attr:`~functools.partial.args` and :attr:`~functools.partial.keywords` member values.
+    If the callable or any member of a :obj:`functools.partial` object is unhashable, the callable is keyed by its identity instead.
+
+    Args:
+        callable_ (callable[..., any]): A callable object. Can be a :obj:`functools.partial` object.
+
+    Returns:
+        hashable: The key used to register the callable.
+    """
+    try:
+        if isinstance(callable_, functools.partial):
+            callableKey = (functools.partial, callable_.func, callable_.args, frozenset((callable_.keywords or {}).iteritems()))
+        else:
+            callableKey = callable_
+
+        hash(callableKey)
+    except TypeError:
+        callableKey = (id, id(callable_))
+
+    return callableKey
+
+
 # A baseclass template used by _CallableData to create a hashable P.O.D object
-_CallableDataBase = collections.namedtuple("_CallableDataBase", ["callable", "receivesCallbackArgs"])
+_CallableDataBase = collections.namedtuple("_CallableDataBase", ["callable", "receivesCallbackArgs", "key"])
 
 
 class _CallableData(_CallableDataBase):
@@ -562,33 +613,50 @@ class _CallableData(_CallableDataBase):
     - ``callable``: The callable object that will be invoked when the Maya event corresponding to the registered :class:`Event` enumeration occurs.
     - ``receivesCallbackArgs``: A boolean value that determines whether the callable will receive any callback arguments if they exist.
 
-    Instances of this class are hashable via the identity of the callable member (however this value is not relied upon when checking if a callable is registered).
+    The registry key for the callable is computed once upon instantiation and stored as the ``key`` member (see :func:`_getCallableKey`).
+    Instances of this class are hashable and compare equal via their ``key`` member, consistent with how callables are keyed in the :data:`_CALLBACK_DATA` registry.
     """
 
     def __new__(cls, callable, receivesCallbackArgs=False):
-        return _CallableDataBase.__new__(cls, callable, receivesCallbackArgs)
+        return _CallableDataBase.__new__(cls, callable, receivesCallbackArgs, _getCallableKey(callable))
+
+    def __eq__(self, other):
+        return isinstance(other, _CallableData) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self == other
 
     def __hash__(self):
-        return id(self.callable)
+        return hash(self.key)
 
 
 # A baseclass template used by _CallbackData to create a P.O.D object
-_CallbackDataBase = collections.namedtuple("_CallbackDataBase", ["callableDataRegistry", "idRegistry"])
+_CallbackDataBase = collections.namedtuple("_CallbackDataBase", ["callableDataRegistry", "noArgCallableRegistry", "argCallableRegistry", "idRegistry"])
 
 
 class _CallbackData(_CallbackDataBase):
     """A simple P.O.D class used exclusively by the global :data:`_CALLBACK_DATA` registry.
 
-    Instances of this class store two internal registries:
+    Instances of this class store four internal registries:
 
-    - ``callableDataRegistry``: Maps subclassed :class:`Event` enumerations to :class:`_CallableData` instances generated by :func:`registerCallable`.
+    - ``callableDataRegistry``: Maps subclassed :class:`Event` enumerations to an :class:`collections.OrderedDict` of :class:`_CallableData` instances generated by :func:`registerCallable`.
+        Each :class:`_CallableData` instance is keyed by its ``key`` member (see :func:`_getCallableKey`), in the order of registration.
         When the Maya event corresponding to a subclassed :class:`Event` enumeration occurs, all registered callables will be invoked.
+    - ``noArgCallableRegistry``: Maps subclassed :class:`Event` enumerations to a :class:`list` of the registered callables which do not receive callback arguments.
+    - ``argCallableRegistry``: Maps subclassed :class:`Event` enumerations to a :class:`list` of the registered callables which receive callback arguments.
+        Both lists are derived from the ``callableDataRegistry`` by :func:`_updateInvocationRegistries` so that :func:`_invokeCallables` does not need to branch per callable.
     - ``idRegistry``: Maps subclassed :class:`Event` enumerations to :class:`maya.api.OpenMaya.MCallbackId` instances.
         When a callback is registered to a Maya event, the returned :class:`maya.api.OpenMaya.MCallbackId` instance is registered to the associated :class:`Event` enumeration.
     """
 
     def __new__(cls):
-        return _CallbackDataBase.__new__(cls, {enumeration: set() for event in _kEvents for enumeration in event}, {enumeration: None for event in _kEvents for enumeration in event})
+        enumerations = [enumeration for event in _kEvents for enumeration in event]
+        return _CallbackDataBase.__new__(
+            cls,
+            {enumeration: collections.OrderedDict() for enumeration in enumerations},
+            {enumeration: [] for enumeration in enumerations},
+            {enumeration: [] for enumeration in enumerations},
+            {enumeration: None for enumeration in enumerations})
 
 
 # --------------------------------------------------------------